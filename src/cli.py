@@ -30,15 +30,7 @@ def cmd_stats(args):
     """Display savings statistics, delegating to src/stats.py."""
     from src.stats import main as stats_main  # noqa: PLC0415
 
-    # Patch sys.argv so stats.main() sees --json if passed
-    original_argv = sys.argv
-    sys.argv = ["stats"]
-    if args.json:
-        sys.argv.append("--json")
-    try:
-        stats_main()
-    finally:
-        sys.argv = original_argv
+    stats_main(["--json"] if args.json else [])
 
 
 def cmd_update(_args):
@@ -3,6 +3,40 @@
 import re
 
 from .base import Processor
+from .utils import SPINNER_CHARS
+
+# Installer/compiler progress noise, one alternation so a single match call
+# classifies a line instead of trying each pattern in turn
+_PROGRESS_LINE_RE = re.compile(
+    r"^\s*(?:"
+    r"(?:Downloading|Installing|Fetching|Resolving|Unpacking|Linking|Extracting)"
+    r"|added \d+ packages?"
+    r"|\d+ packages? are looking"
+    r"|(?:GET|fetch)\s+http"
+    r"|npm\s+(?:WARN|notice|warn)\b"
+    r"|\d+(?:\.\d+)?\s*%"
+    rf"|[{SPINNER_CHARS}]"
+    r"|\[\d+/\d+\]"  # [1/5] progress indicators
+    r"|(?:Compiling|Updating|Preparing)\s+\S+"  # cargo
+    r"|Already up to date"
+    r"|Using\s+(?:cached|version)\b"
+    r"|Collecting\s+\S+"  # pip
+    r"|━"  # pip progress bar
+    r"|\u27a4?\s*YN\d+:.*\b(?:Resolution|Fetch|Link)\s+step\b"  # yarn berry v2+
+    r"|Progress:\s+resolved\s+\d+"  # pnpm resolved/reused/downloaded stats
+    r"|[Pp]ackages?\s+(?:are|is)\s+hard linked"  # pnpm content-addressable store
+    r")"
+)
+# Every character a stripped line matching _PROGRESS_LINE_RE can start with
+# (keep in sync with its alternatives); lines starting with anything else are
+# rejected by one set lookup before the regex runs
+_PROGRESS_FIRST_CHARS = frozenset("DIFRULEa0123456789Gfn[CPA━➤Yp" + SPINNER_CHARS)
+_WARNING_WORD_RE = re.compile(r"\bwarn(ing)?\b", re.IGNORECASE)
+_DOCKER_STEP_RE = re.compile(r"^(Step \d+/\d+|#\d+\s|\[\d+/\d+\])")
+_DOCKER_ERROR_RE = re.compile(r"\b(error|Error|ERROR|failed|FAILED)\b")
+_DOCKER_RESULT_RE = re.compile(
+    r"(Successfully (built|tagged)|naming to |writing image|DONE)", re.IGNORECASE
+)
 
 
 class BuildOutputProcessor(Processor):
@@ -143,7 +177,7 @@ class BuildOutputProcessor(Processor):
             if self._is_progress_line(stripped):
                 continue
 
-            if re.search(r"\bwarn(ing)?\b", stripped, re.IGNORECASE):
+            if _WARNING_WORD_RE.search(stripped):
                 warning_count += 1
                 if len(warning_samples) < 5:
                     warning_samples.append(stripped)
@@ -198,32 +232,22 @@ class BuildOutputProcessor(Processor):
             stripped = line.strip()
 
             # Keep step headers
-            if re.match(r"^(Step \d+/\d+|#\d+\s|\[\d+/\d+\])", stripped):
+            if _DOCKER_STEP_RE.match(stripped):
                 step_count += 1
                 result.append(stripped)
                 continue
 
             # Always keep errors
-            if re.search(r"\b(error|Error|ERROR|failed|FAILED)\b", stripped):
+            if _DOCKER_ERROR_RE.search(stripped):
                 result.append(stripped)
                 continue
 
             # Keep final image/tag info
-            if re.search(
-                r"(Successfully (built|tagged)|naming to |writing image|DONE)",
-                stripped,
-                re.IGNORECASE,
-            ):
+            if _DOCKER_RESULT_RE.search(stripped):
                 result.append(stripped)
-                continue
 
-            # Skip noise: intermediate containers, sha256 hashes, RUN output details
-            if re.match(r"^(Running in |Removing intermediate| ---> |sha256:)", stripped):
-                continue
-            if re.match(r"^(Sending build context|Downloading|Extracting|Pulling)", stripped):
-                continue
-            if re.search(r"\d+(\.\d+)?%", stripped):
-                continue
+            # Everything else is noise (intermediate containers, sha256
+            # hashes, build context upload, RUN output) and is dropped
 
         if not result:
             return "\n".join(lines[-10:])
@@ -333,24 +357,4 @@ class BuildOutputProcessor(Processor):
         return "\n".join(result)
 
     def _is_progress_line(self, line: str) -> bool:
-        if not line:
-            return False
-        patterns = [
-            r"^\s*(Downloading|Installing|Fetching|Resolving|Unpacking|Linking|Extracting)",
-            r"^\s*added \d+ packages?",
-            r"^\s*\d+ packages? are looking",
-            r"^\s*(GET|fetch)\s+http",
-            r"^\s*npm\s+(WARN|notice|warn)\b",
-            r"^\s*\d+(\.\d+)?\s*%",
-            r"^\s*(⠋|⠙|⠹|⠸|⠼|⠴|⠦|⠧|⠇|⠏|⣾|⣽|⣻|⢿|⡿|⣟|⣯|⣷)",
-            r"^\s*\[\d+/\d+\]",  # [1/5] progress indicators
-            r"^\s*(Compiling|Updating|Preparing)\s+\S+",  # cargo
-            r"^\s*Already up to date",
-            r"^\s*Using\s+(cached|version)\b",
-            r"^\s*Collecting\s+\S+",  # pip
-            r"^\s*━",  # pip progress bar
-            r"^\s*\u27a4?\s*YN\d+:.*\b(Resolution|Fetch|Link)\s+step\b",  # yarn berry v2+
-            r"^\s*Progress:\s+resolved\s+\d+",  # pnpm resolved/reused/downloaded stats
-            r"^\s*[Pp]ackages?\s+(are|is)\s+hard linked",  # pnpm content-addressable store
-        ]
-        return any(re.match(p, line) for p in patterns)
+        return line[:1] in _PROGRESS_FIRST_CHARS and _PROGRESS_LINE_RE.match(line) is not None
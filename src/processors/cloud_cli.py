@@ -13,6 +13,11 @@ _IMPORTANT_KEY_RE = re.compile(
     r"|code|reason|type|tags?|key|value|label)"
 )
 
+# Table border/separator rows (aws --output table, box-drawing variants)
+_TABLE_SEP_RE = re.compile(r"^[+\-|─┼]+$")
+# Space-aligned columns (gcloud/az default table format)
+_TABLE_COLUMNS_RE = re.compile(r"\w+\s{2,}\w+\s{2,}\w+")
+
 
 class CloudCliProcessor(Processor):
     priority = 39
@@ -77,9 +82,9 @@ class CloudCliProcessor(Processor):
         """Detect table output format."""
         for line in lines[:5]:
             stripped = line.strip()
-            if re.match(r"^[+\-|─┼]+$", stripped):
+            if _TABLE_SEP_RE.match(stripped):
                 return True
-            if re.search(r"\w+\s{2,}\w+\s{2,}\w+", stripped):
+            if _TABLE_COLUMNS_RE.search(stripped):
                 return True
         return False
 
@@ -88,7 +93,7 @@ class CloudCliProcessor(Processor):
         header_end = 0
         for i, line in enumerate(lines[:5]):
             stripped = line.strip()
-            if re.match(r"^[+\\-|─┼]+$", stripped):
+            if _TABLE_SEP_RE.match(stripped):
                 header_end = i + 1
             elif stripped and header_end > 0:
                 break
@@ -96,9 +101,10 @@ class CloudCliProcessor(Processor):
         if header_end == 0:
             header_end = 1
 
-        sep_re = re.compile(r"^[+\-|─┼]+$")
         data_lines = [
-            row for row in lines[header_end:] if not sep_re.match(row.strip()) and row.strip()
+            row
+            for row in lines[header_end:]
+            if not _TABLE_SEP_RE.match(row.strip()) and row.strip()
         ]
 
         if len(data_lines) <= 20:
@@ -19,6 +19,25 @@ _DOCKER_CMD_RE = re.compile(
     r"(ps|images|logs|pull|push|inspect|stats|"
     r"compose\s+(?:ps|logs|up|down|build))\b"
 )
+_STOPPED_STATUS_RE = re.compile(r"\b(Exited|Created|Dead)\b")
+_LOG_ERROR_RE = re.compile(r"\b(error|ERROR|exception|fatal|FATAL|panic)\b", re.I)
+_PULL_LAYER_RE = re.compile(
+    r"^[0-9a-f]+:\s*(Downloading|Extracting|Pulling|Waiting|"
+    r"Verifying|Download complete|Pull complete|Already exists)"
+)
+_PERCENT_RE = re.compile(r"\d+(\.\d+)?%")
+_PULL_BAR_RE = re.compile(r"\[=*>?\s*\]")
+_COMPOSE_UP_STATUS_RE = re.compile(r"(Created|Started|Running|Healthy|Error|error|failed)", re.I)
+_COMPOSE_UP_RESOURCE_RE = re.compile(r"(Network|Volume)\s+\S+\s+(Created|Found)")
+_COMPOSE_UP_PROGRESS_RE = re.compile(r"(Pulling|Building|Creating|Starting)")
+# Also covers "Network x Removed" / "Volume x Removed" lines
+_COMPOSE_DOWN_RE = re.compile(r"(Stopped|Removed|Removing|removed)", re.I)
+_COMPOSE_BUILD_RE = re.compile(
+    r"^\S+\s+(Building|building)"
+    r"|^(Step \d+/\d+|#\d+\s|\[\d+/\d+\])"
+    r"|\b(error|Error|ERROR|failed|FAILED)\b"
+    r"|(?i:Successfully|naming to |writing image|DONE)"
+)
 
 
 class DockerProcessor(Processor):
@@ -106,7 +125,7 @@ class DockerProcessor(Processor):
 
         # Group by status
         running = [e for e in result_entries if "Up " in e]
-        stopped = [e for e in result_entries if re.search(r"\b(Exited|Created|Dead)\b", e)]
+        stopped = [e for e in result_entries if _STOPPED_STATUS_RE.search(e)]
         other = [e for e in result_entries if e not in running and e not in stopped]
 
         result = [f"{len(entries)} containers:"]
@@ -205,17 +224,13 @@ class DockerProcessor(Processor):
         for service, svc_lines in sorted(service_lines.items()):
             if service == "_other":
                 continue
-            error_count = sum(
-                1
-                for ln in svc_lines
-                if re.search(r"\b(error|ERROR|exception|fatal|FATAL|panic)\b", ln, re.I)
-            )
+            error_count = sum(1 for ln in svc_lines if _LOG_ERROR_RE.search(ln))
             result.append(f"\n--- {service} ({len(svc_lines)} lines, {error_count} errors) ---")
 
             # Show errors with context + last 3 lines
             errors_shown: list[str] = []
             for i, line in enumerate(svc_lines):
-                if re.search(r"\b(error|ERROR|exception|fatal|FATAL|panic)\b", line, re.I):
+                if _LOG_ERROR_RE.search(line):
                     start = max(0, i - 1)
                     end = min(len(svc_lines), i + 2)
                     for el in svc_lines[start:end]:
@@ -239,14 +254,10 @@ class DockerProcessor(Processor):
         for line in lines:
             stripped = line.strip()
             # Skip layer progress
-            if re.match(
-                r"^[0-9a-f]+:\s*(Downloading|Extracting|Pulling|Waiting|"
-                r"Verifying|Download complete|Pull complete|Already exists)",
-                stripped,
-            ):
+            if _PULL_LAYER_RE.match(stripped):
                 continue
             # Skip progress bars
-            if re.search(r"\d+(\.\d+)?%", stripped) and re.search(r"\[=*>?\s*\]", stripped):
+            if _PERCENT_RE.search(stripped) and _PULL_BAR_RE.search(stripped):
                 continue
             result.append(stripped)
 
@@ -255,10 +266,11 @@ class DockerProcessor(Processor):
     def _process_inspect(self, output: str) -> str:
         """Compress docker inspect: summarize JSON structure."""
         lines = output.splitlines()
-        raw = "\n".join(lines)
 
+        # Decode the original text: rejoining split lines would re-copy the
+        # whole buffer and break JSON strings containing U+2028/U+2029.
         try:
-            data = json.loads(raw)
+            data = json.loads(output)
         except (json.JSONDecodeError, ValueError):
             # Not valid JSON -- truncate
             if len(lines) > 50:
@@ -358,13 +370,11 @@ class DockerProcessor(Processor):
 
         # docker stats --no-stream produces a header + rows
         # docker stats (streaming) produces repeated blocks
-        # Keep only the last block
-        header_indices = [
-            i for i, line in enumerate(lines) if "CONTAINER" in line and "CPU" in line
-        ]
-        if header_indices:
-            last_header = header_indices[-1]
-            return "\n".join(lines[last_header:])
+        # Keep only the last block: scan back from the end for its header
+        for i in range(len(lines) - 1, -1, -1):
+            line = lines[i]
+            if "CONTAINER" in line and "CPU" in line:
+                return "\n".join(lines[i:])
 
         return output
 
@@ -378,12 +388,9 @@ class DockerProcessor(Processor):
         for line in lines:
             stripped = line.strip()
             if (
-                re.search(r"(Created|Started|Running|Healthy|Error|error|failed)", stripped, re.I)
-                or re.search(r"(Network|Volume)\s+\S+\s+(Created|Found)", stripped)
-                or (
-                    re.search(r"(Pulling|Building|Creating|Starting)", stripped)
-                    and not re.search(r"\d+%", stripped)
-                )
+                _COMPOSE_UP_STATUS_RE.search(stripped)
+                or _COMPOSE_UP_RESOURCE_RE.search(stripped)
+                or (_COMPOSE_UP_PROGRESS_RE.search(stripped) and not _PERCENT_RE.search(stripped))
             ):
                 result.append(stripped)
 
@@ -400,9 +407,7 @@ class DockerProcessor(Processor):
         result = []
         for line in lines:
             stripped = line.strip()
-            if re.search(r"(Stopped|Removed|Removing|removed)", stripped, re.I) or re.search(
-                r"(Network|Volume)\s+\S+\s+(Removed|removed)", stripped
-            ):
+            if _COMPOSE_DOWN_RE.search(stripped):
                 result.append(stripped)
 
         if not result:
@@ -418,12 +423,7 @@ class DockerProcessor(Processor):
         result = []
         for line in lines:
             stripped = line.strip()
-            if (
-                re.match(r"^\S+\s+(Building|building)", stripped)
-                or re.match(r"^(Step \d+/\d+|#\d+\s|\[\d+/\d+\])", stripped)
-                or re.search(r"\b(error|Error|ERROR|failed|FAILED)\b", stripped)
-                or re.search(r"(Successfully|naming to |writing image|DONE)", stripped, re.I)
-            ):
+            if _COMPOSE_BUILD_RE.search(stripped):
                 result.append(stripped)
 
         if not result:
@@ -96,11 +96,10 @@ class EnvProcessor(Processor):
             if not stripped or "=" not in stripped:
                 continue
 
-            key = stripped.split("=", 1)[0]
-            value = stripped.split("=", 1)[1]
+            key, _, value = stripped.partition("=")
 
             # Filter system variables
-            if any(key.startswith(prefix) for prefix in _SYSTEM_PREFIXES):
+            if key.startswith(_SYSTEM_PREFIXES):
                 system_count += 1
                 continue
 
@@ -16,7 +16,7 @@ import re
 
 from .. import config
 from .base import Processor
-from .utils import compress_json_value, compress_log_lines
+from .utils import compress_json_value, compress_log_lines, count_lines, head_lines, tail_lines
 
 # ── File type sets ───────────────────────────────────────────────────
 
@@ -145,12 +145,13 @@ class FileContentProcessor(Processor):
 
         ext = self._extract_extension(command)
         filename = self._extract_filename(command)
+        # Count lines without splitting: source code and short files pass
+        # through untouched, so the line list is only built when needed
+        total_lines = count_lines(output)
 
         # ── COMPRESS: minified files (never useful for patching) ──────
-        if self._is_minified(ext, filename, output):
-            lines = output.splitlines()
+        if self._is_minified(filename, output, total_lines):
             total_chars = len(output)
-            total_lines = len(lines)
             preview = output[:200].replace("\n", " ")
             return (
                 f"[minified file: {filename or 'unknown'}, "
@@ -171,44 +172,43 @@ class FileContentProcessor(Processor):
             return output
 
         # Below here: only compress if the output is long enough
-        lines = output.splitlines()
         max_lines = config.get("max_file_lines")
 
-        if len(lines) <= max_lines:
+        if total_lines <= max_lines:
             return output
 
         # ── Lock files: aggressive compression ───────────────────────
         if filename in _LOCK_FILENAMES:
-            return self._compress_lock_file(lines, ext, filename)
+            return self._compress_lock_file(output.splitlines(), ext, filename)
 
         # ── Structured data: preserve keys + structure ───────────────
         structured_type = _STRUCTURED_EXTENSIONS.get(ext)
         if structured_type:
-            return self._compress_structured(lines, structured_type)
+            return self._compress_structured(output.splitlines(), structured_type)
 
         # ── Log files ────────────────────────────────────────────────
         if ext in _LOG_EXTENSIONS:
-            return self._compress_log(lines)
+            return self._compress_log(output.splitlines())
 
         # ── CSV/TSV ──────────────────────────────────────────────────
         if ext in _CSV_EXTENSIONS:
-            return self._compress_csv(lines)
+            return self._compress_csv(output.splitlines())
 
         # ── Documentation ────────────────────────────────────────────
         if ext in _DOC_EXTENSIONS:
-            return self._truncate_default(lines)
+            return self._truncate_text(output, total_lines)
 
         # ── Heuristic detection for extensionless/unknown files ──────
-        detected = self._detect_heuristic(lines)
+        detected = self._detect_heuristic(output)
         if detected == "log":
-            return self._compress_log(lines)
+            return self._compress_log(output.splitlines())
         if detected == "json":
-            return self._compress_structured(lines, "json")
+            return self._compress_structured(output.splitlines(), "json")
         if detected == "csv":
-            return self._compress_csv(lines)
+            return self._compress_csv(output.splitlines())
 
         # ── Unknown: conservative generic compression ────────────────
-        return self._truncate_default(lines)
+        return self._truncate_text(output, total_lines)
 
     # ── Filename / extension extraction ──────────────────────────────
 
@@ -244,7 +244,7 @@ class FileContentProcessor(Processor):
 
     # ── Minified file detection ─────────────────────────────────────
 
-    def _is_minified(self, ext: str, filename: str, output: str) -> bool:
+    def _is_minified(self, filename: str, output: str, total_lines: int) -> bool:
         """Detect minified files by name pattern or content heuristics."""
         # Name-based detection
         if re.search(r"\.min\.(js|css|html)$", filename, re.I):
@@ -253,11 +253,10 @@ class FileContentProcessor(Processor):
             return True
 
         # Content heuristic: very few lines relative to total length
-        lines = output.splitlines()
-        if len(lines) <= 3 and len(output) > 5000:
+        if total_lines <= 3 and len(output) > 5000:
             return True
         # Average line length > 500 chars
-        return bool(lines and len(output) / len(lines) > 500)
+        return bool(total_lines and len(output) / total_lines > 500)
 
     # ── .env variant detection ──────────────────────────────────────
 
@@ -298,21 +297,20 @@ class FileContentProcessor(Processor):
 
     # ── Heuristic detection (for extensionless files) ────────────────
 
-    def _detect_heuristic(self, lines: list[str]) -> str:
+    def _detect_heuristic(self, output: str) -> str:
         """Detect content type from content heuristics."""
         # Log detection (>30% lines match log patterns)
-        sample = lines[:200]
+        sample = head_lines(output, 200).split("\n")
         log_matches = sum(1 for line in sample if _LOG_LEVEL_RE.search(line))
         if log_matches > len(sample) * 0.3:
             return "log"
 
         # JSON (starts with { or [)
-        first_char = _output_start(lines)
-        if first_char in ("{", "["):
+        if output.lstrip().startswith(("{", "[")):
             return "json"
 
         # CSV (consistent separators)
-        if self._looks_like_csv(lines[:10]):
+        if self._looks_like_csv(sample[:10]):
             return "csv"
 
         return "unknown"
@@ -604,26 +602,21 @@ class FileContentProcessor(Processor):
     # ── Fallback: head/tail truncation ───────────────────────────────
 
     def _truncate_default(self, lines: list[str]) -> str:
+        """List form of :meth:`_truncate_text` for paths that already split."""
+        # The trailing newline makes the join an exact inverse of splitlines(),
+        # so a final blank line still counts as a line
+        return self._truncate_text("\n".join(lines) + "\n", len(lines))
+
+    def _truncate_text(self, output: str, total: int) -> str:
+        """Keep the first and last lines of *output* around a truncation marker.
+
+        Slices *output* directly rather than splitting it into a line list.
+        """
         keep_head = config.get("file_keep_head")
         keep_tail = config.get("file_keep_tail")
-        total = len(lines)
         truncated = total - keep_head - keep_tail
-
-        result = [
-            *lines[:keep_head],
-            f"\n... ({truncated} lines truncated, {total} total lines) ...\n",
-            *lines[-keep_tail:],
-        ]
-        return "\n".join(result)
-
-
-# ── Helpers ──────────────────────────────────────────────────────────
-
-
-def _output_start(lines: list[str]) -> str:
-    """Return the first non-whitespace character of the output."""
-    for line in lines:
-        stripped = line.strip()
-        if stripped:
-            return stripped[0]
-    return ""
+        return (
+            f"{head_lines(output, keep_head)}\n"
+            f"\n... ({truncated} lines truncated, {total} total lines) ...\n\n"
+            f"{tail_lines(output, keep_tail)}"
+        )
@@ -1,7 +1,7 @@
 """File listing processor: ls, find, tree."""
 
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from .. import config
 from .base import Processor
@@ -34,31 +34,51 @@ class FileListingProcessor(Processor):
             return self._process_ls(output, command)
         return output
 
-    # Regex for ls -l long-format lines:
-    # drwxr-xr-x  5 user group  160 Jan 17 12:34 dirname
-    # Regex for ls -l long-format lines (locale-agnostic).
-    # We capture: type char, size, and everything after the date as filename.
-    # The date field varies by locale (EN: "Jan 12 17:24", FR: "12 janv. 17:24"),
-    # so we match it as: groups of (non-digit-word-chars or digits) ending with HH:MM or year.
-    _LS_LONG_RE = re.compile(
-        r"^([d\-lbcps])"  # 1: type indicator
-        r"[rwxsStT\-]{9}[@+.]?\s+"  # permissions
-        r"\d+\s+"  # nlinks
-        r"\S+\s+"  # owner
-        r"\S+\s+"  # group
-        r"(\d+)\s+"  # 2: size in bytes
-        r"(?:\S+\s+){2,3}"  # date tokens (2-3 space-separated tokens: month/day + time/year)
-        r"(\S.*?)$"  # 3: filename (rest of line, trimmed)
-    )
+    # ls -l long-format lines are tokenized with str.split rather than one
+    # large regex:
+    #   drwxr-xr-x  5 user group  160 Jan 17 12:34 dirname
+    # Fields: permissions, nlinks, owner, group, size, date, filename. The date
+    # varies by locale (EN: "Jan 12 17:24", FR: "12 janv. 17:24") but is three
+    # tokens, except --time-style=long-iso ("2025-01-12 17:24") which is two
+    # and full-iso which adds a timezone token.
+    _LS_PERMS_RE = re.compile(r"[d\-lbcps][rwxsStT\-]{9}[@+.]?$")
+    _ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+    _TZ_OFFSET_RE = re.compile(r"[+-]\d{4}$")
+
+    def _parse_ls_long(self, line: str) -> tuple[str, int, str] | None:
+        """Split an ``ls -l`` line into (type char, size, filename)."""
+        parts = line.split(None, 7)
+        if (
+            len(parts) < 8
+            or not self._LS_PERMS_RE.match(parts[0])
+            or not parts[1].isdigit()
+            or not parts[4].isdigit()
+        ):
+            return None
+        name = parts[7]
+        if self._ISO_DATE_RE.match(parts[5]):
+            # Two-token ISO date; full-iso appends a timezone offset token
+            tz, _, rest = name.partition(" ")
+            if rest and self._TZ_OFFSET_RE.match(tz):
+                name = rest.lstrip()
+        else:
+            # Three-token date: the first word of the remainder is its last token
+            _, _, name = name.partition(" ")
+            name = name.lstrip()
+            if not name:
+                return None
+        return parts[0][0], int(parts[4]), name
+
+    # Units indexed by power of 1024 (picked from the size's bit length), with
+    # the number of decimals shown for each; everything >= 1 GiB is in G.
+    _SIZE_UNITS = ("B", "K", "M", "G")
+    _SIZE_DECIMALS = (0, 0, 1, 1)
 
     def _format_size(self, size: int) -> str:
         if size < 1024:
             return f"{size}B"
-        if size < 1024 * 1024:
-            return f"{size / 1024:.0f}K"
-        if size < 1024 * 1024 * 1024:
-            return f"{size / (1024 * 1024):.1f}M"
-        return f"{size / (1024 * 1024 * 1024):.1f}G"
+        exp = min((size.bit_length() - 1) // 10, 3)
+        return f"{size / (1 << 10 * exp):.{self._SIZE_DECIMALS[exp]}f}{self._SIZE_UNITS[exp]}"
 
     def _process_ls(self, output: str, command: str) -> str:
         lines = output.splitlines()
@@ -69,12 +89,11 @@ class FileListingProcessor(Processor):
             for line in lines:
                 if line.startswith("total"):
                     continue
-                match = self._LS_LONG_RE.match(line)
-                if not match:
+                parsed = self._parse_ls_long(line)
+                if not parsed:
                     result.append(line)
                     continue
-                type_char, size_str, name = match.groups()
-                size = int(size_str)
+                type_char, size, name = parsed
                 if type_char == "d":
                     result.append(f"  {name}/")
                 elif type_char == "l":
@@ -140,13 +159,8 @@ class FileListingProcessor(Processor):
         for dir_path, files in sorted(by_dir.items()):
             if len(files) > 20:
                 # Show extension breakdown
-                exts: dict[str, int] = defaultdict(int)
-                for f in files:
-                    ext = f.rsplit(".", 1)[-1] if "." in f else "(none)"
-                    exts[ext] += 1
-                ext_desc = ", ".join(
-                    f"*.{e}:{n}" for e, n in sorted(exts.items(), key=lambda x: -x[1])[:4]
-                )
+                exts = Counter(f.rsplit(".", 1)[-1] if "." in f else "(none)" for f in files)
+                ext_desc = ", ".join(f"*.{e}:{n}" for e, n in exts.most_common(4))
                 result.append(f"  {dir_path}/ ({len(files)} files: {ext_desc})")
             elif len(files) > 5:
                 result.append(f"  {dir_path}/ ({len(files)} files): {', '.join(files[:3])} ...")
@@ -1,16 +1,57 @@
 """Generic fallback processor: ANSI strip, dedup, whitespace collapse, truncation."""
 
 import re
+from itertools import groupby
 
 from .. import config
 from .base import Processor
+from .utils import SPINNER_CHARS
 
-ANSI_RE = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]|\x1b\].*?\x07")
+# CSI sequences (colors, cursor movement) and OSC sequences (window title,
+# hyperlinks) terminated by BEL or ST, in one alternation so a single
+# pass over the text strips both.
+ANSI_RE = re.compile(r"\x1b(?:\[[0-9;?]*[ -/]*[@-~]|\][^\x07\x1b\r\n]*(?:\x07|\x1b\\))")
+
+# Runs of 2+ blank lines in text rejoined from _rstrip_lines, so blank
+# lines are empty and every line break is a bare LF
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
 
 # Regex to normalize numbers/percentages for fuzzy matching
 _NUMERIC_RE = re.compile(r"\d+(\.\d+)?")
+# Deletes ASCII digits; the length difference counts them in one C-level pass
+_DIGITS_DELETE = str.maketrans("", "", "0123456789")
+_PERCENT_RE = re.compile(r"\d+(\.\d+)?%")
+_RATE_RE = re.compile(r"\d+(\.\d+)?\s*(KB|MB|GB|B|kB|MiB|GiB|k|M|G)/s")
+_ETA_RE = re.compile(r"(ETA|eta)\s+\d+")
+_CLOCK_RE = re.compile(r"--:--:--|(\d+:){2}\d+")
 # Progress bar visual characters
 _PROGRESS_BAR_RE = re.compile(r"[━█▓░▒■□●○#=\->]{5,}")
+# Lines consisting of a single spinner frame
+_SPINNER_FRAMES = frozenset(SPINNER_CHARS)
+
+
+def _count_digits(text: str) -> int:
+    return len(text) - len(text.translate(_DIGITS_DELETE))
+
+
+def _rstrip_lines(text: str) -> list[str]:
+    """Split into lines with trailing whitespace removed.
+
+    A per-line ``str.rstrip`` beats a whole-buffer regex here: the regex has
+    to attempt a match at every space between words, not just at line ends.
+    """
+    lines = [line.rstrip() for line in text.splitlines()]
+    # A whitespace-only final line without a line break is dropped entirely
+    if lines and not lines[-1] and not text.endswith(("\n", "\r")):
+        lines.pop()
+    return lines
+
+
+def _strip_ansi(text: str) -> str:
+    """Remove escape sequences, skipping the regex scan when there is no ESC."""
+    if "\x1b" not in text:
+        return text
+    return ANSI_RE.sub("", text)
 
 
 class GenericProcessor(Processor):
@@ -27,13 +68,11 @@ class GenericProcessor(Processor):
         return True  # Always matches as fallback
 
     def process(self, command: str, output: str) -> str:
-        lines = output.splitlines()
-        lines = self._strip_ansi(lines)
+        lines = _rstrip_lines(_strip_ansi(output))
         lines = self._strip_progress_bars(lines)
         lines = self._collapse_blank_lines(lines)
         lines = self._collapse_repeated_lines(lines)
         lines = self._collapse_similar_lines(lines)
-        lines = self._strip_trailing_whitespace(lines)
         threshold = config.get("generic_truncate_threshold")
         if len(lines) > threshold:
             lines = self._truncate_middle(lines)
@@ -45,17 +84,17 @@ class GenericProcessor(Processor):
         Used by the engine after a specialized processor to sanitize output
         without applying heavy dedup or truncation.
         """
-        lines = text.splitlines()
-        lines = self._strip_ansi(lines)
-        lines = self._collapse_blank_lines(lines)
-        lines = self._strip_trailing_whitespace(lines)
-        return "\n".join(lines)
-
-    def _strip_ansi(self, lines: list[str]) -> list[str]:
-        return [ANSI_RE.sub("", line) for line in lines]
-
-    def _strip_trailing_whitespace(self, lines: list[str]) -> list[str]:
-        return [line.rstrip() for line in lines]
+        text = _strip_ansi(text)
+        ends_with_newline = text.rstrip(" \t").endswith(("\n", "\r"))
+        text = "\n".join(_rstrip_lines(text))
+        if ends_with_newline:
+            text += "\n"
+        # Substring tests skip the regex on the common no-blank-run text
+        if "\n\n\n" in text:
+            text = _BLANK_RUN_RE.sub("\n\n", text)
+        if text.startswith("\n\n"):
+            text = "\n" + text.lstrip("\n")
+        return "\n".join(text.splitlines())
 
     def _strip_progress_bars(self, lines: list[str]) -> list[str]:
         """Remove lines that are purely progress bars or spinners."""
@@ -63,31 +102,11 @@ class GenericProcessor(Processor):
         for line in lines:
             stripped = line.strip()
             # Pure progress bar lines (>60% bar characters)
-            if stripped and _PROGRESS_BAR_RE.search(stripped):
-                bar_match = _PROGRESS_BAR_RE.search(stripped)
-                if bar_match and len(bar_match.group(0)) > len(stripped) * 0.5:
-                    continue
+            bar_match = _PROGRESS_BAR_RE.search(stripped)
+            if bar_match and len(bar_match.group(0)) > len(stripped) * 0.5:
+                continue
             # Spinner lines
-            if stripped in (
-                "⠋",
-                "⠙",
-                "⠹",
-                "⠸",
-                "⠼",
-                "⠴",
-                "⠦",
-                "⠧",
-                "⠇",
-                "⠏",
-                "⣾",
-                "⣽",
-                "⣻",
-                "⢿",
-                "⡿",
-                "⣟",
-                "⣯",
-                "⣷",
-            ):
+            if stripped in _SPINNER_FRAMES:
                 continue
             result.append(line)
         return result
@@ -106,19 +125,13 @@ class GenericProcessor(Processor):
 
     def _collapse_repeated_lines(self, lines: list[str]) -> list[str]:
         """Collapse consecutive identical lines into `line (xN)`."""
-        if not lines:
-            return lines
         result: list[str] = []
-        current = lines[0]
-        count = 1
-        for line in lines[1:]:
-            if line == current and current.strip():
-                count += 1
+        for line, group in groupby(lines):
+            count = sum(1 for _ in group)
+            if line.strip():
+                self._flush(result, line, count)
             else:
-                self._flush(result, current, count)
-                current = line
-                count = 1
-        self._flush(result, current, count)
+                result.extend([line] * count)
         return result
 
     def _collapse_similar_lines(self, lines: list[str]) -> list[str]:
@@ -133,22 +146,26 @@ class GenericProcessor(Processor):
         result: list[str] = []
         current = lines[0]
         current_normalized = self._normalize_numbers(current)
+        # Whether the group's first line may absorb similar lines; computed
+        # lazily once per group rather than once per compared line
+        current_collapsible: bool | None = None
         group: list[str] = [current]
 
         for line in lines[1:]:
             normalized = self._normalize_numbers(line)
-            if (
-                normalized == current_normalized
-                and current.strip()
-                and len(current.strip()) > 10
-                and self._is_numeric_heavy(current)
-            ):
-                group.append(line)
-            else:
-                self._flush_similar(result, group)
-                current = line
-                current_normalized = normalized
-                group = [line]
+            if normalized == current_normalized:
+                if current_collapsible is None:
+                    current_collapsible = len(current.strip()) > 10 and self._is_numeric_heavy(
+                        current
+                    )
+                if current_collapsible:
+                    group.append(line)
+                    continue
+            self._flush_similar(result, group)
+            current = line
+            current_normalized = normalized
+            current_collapsible = None
+            group = [line]
 
         self._flush_similar(result, group)
         return result
@@ -167,24 +184,24 @@ class GenericProcessor(Processor):
         if not stripped:
             return False
         # Count digits + common numeric-adjacent chars (colons for time, dashes for ETA)
-        numeric_chars = sum(1 for c in stripped if c.isdigit())
+        numeric_chars = _count_digits(stripped)
         if numeric_chars / len(stripped) >= 0.30:
             return True
         # Percentage patterns
-        if re.search(r"\d+(\.\d+)?%", stripped):
+        if _PERCENT_RE.search(stripped):
             return True
         # Transfer rate patterns
-        if re.search(r"\d+(\.\d+)?\s*(KB|MB|GB|B|kB|MiB|GiB|k|M|G)/s", stripped):
+        if _RATE_RE.search(stripped):
             return True
         # ETA/time remaining patterns
-        if re.search(r"(ETA|eta)\s+\d+", stripped):
+        if _ETA_RE.search(stripped):
             return True
         # Curl/wget progress format: lines with --:--:-- time patterns
-        if re.search(r"--:--:--|(\d+:){2}\d+", stripped) and numeric_chars >= 5:
+        if _CLOCK_RE.search(stripped) and numeric_chars >= 5:
             return True
         # Lines that are mostly whitespace + numbers (tabular numeric output)
         non_ws = stripped.replace(" ", "")
-        return bool(non_ws and sum(1 for c in non_ws if c.isdigit()) / len(non_ws) >= 0.40)
+        return bool(non_ws and numeric_chars / len(non_ws) >= 0.40)
 
     def _flush(self, result: list[str], line: str, count: int) -> None:
         if count > 1:
@@ -1,10 +1,11 @@
 """Git output processor: status, diff, log, show, push/pull/fetch, reflog, branch, blame."""
 
 import re
+from collections import Counter
 
 from .. import config
 from .base import Processor
-from .utils import compress_diff
+from .utils import compress_diff, count_lines, head_lines
 
 # Optional git global options that may appear between 'git' and the subcommand.
 # Covers: -C <path>, --no-pager, -c <key>=<val>, --git-dir <path>, --work-tree <path>
@@ -19,6 +20,29 @@ _GIT_SUBCMDS = (
 )
 _GIT_CMD_RE = re.compile(rf"\bgit\s+{_GIT_OPTS}{_GIT_SUBCMDS}\b")
 
+# Standard blame format: hash (Author YYYY-MM-DD HH:MM:SS +TZ  linenum) content
+_BLAME_RE = re.compile(r"^[0-9a-f]+\s+\((.+?)\s+\d{4}-\d{2}-\d{2}\s+")
+# Short blame: ^hash (Author date linenum)
+_BLAME_SHORT_RE = re.compile(r"^\^?[0-9a-f]+\s+\((.+?)\s+\d{4}")
+
+# Per-line patterns, compiled once at import
+_STATUS_SHORT_RE = re.compile(r"^([MADRCTU?! ]{1,2})\s+(.+)$")
+_DIFF_HEADER_RE = re.compile(r"^diff --git a/(.+?) b/")
+_NAME_STATUS_RE = re.compile(r"^([MADRCTU])\d*\s+(.+)$")
+# --stat lines: " path/file | 5 ++-"
+_STAT_LINE_RE = re.compile(r"^\s*.+?\s+\|\s+\d+")
+_STAT_WITH_BARS_RE = re.compile(r"^(\s*.+?\s+\|\s+\d+)\s+[+\-]+\s*$")
+_STAT_SPLIT_RE = re.compile(r"^\s*(.+?)\s+\|\s+(.+)$")
+_STAT_SUMMARY_RE = re.compile(r"\s*\d+ files? changed")
+_FIRST_NUMBER_RE = re.compile(r"(\d+)")
+_LOG_GRAPH_RE = re.compile(r"^[|*/\\ ]*[|*/\\]")
+_TRANSFER_NOISE_RE = re.compile(
+    r"^(Receiving|Resolving|Counting|Compressing|"
+    r"remote:\s*(Counting|Compressing|Total|Enumerating))"
+)
+_PERCENT_RE = re.compile(r"\d+%")
+_FETCH_PUSH_SUFFIX_RE = re.compile(r"\s+\((fetch|push)\)\s*$")
+
 
 class GitProcessor(Processor):
     priority = 20
@@ -136,7 +160,7 @@ class GitProcessor(Processor):
                 code, filepath = "UD", stripped.split(":", 1)[1].strip()
             # Parse short-format status: XY filename
             # Supports all status codes: M, A, D, R, C, U, ?, !
-            elif status_m := re.match(r"^([MADRCTU?! ]{1,2})\s+(.+)$", stripped):
+            elif status_m := _STATUS_SHORT_RE.match(stripped):
                 code_raw = status_m.group(1).strip()
                 filepath = status_m.group(2).strip().strip('"')
                 code = code_raw[0] if code_raw[0] != " " else code_raw[-1]
@@ -163,10 +187,7 @@ class GitProcessor(Processor):
 
         for dir_name, files in sorted(files_by_dir.items()):
             if len(files) > 8:
-                codes: dict[str, int] = {}
-                for f in files:
-                    c = f.split(" ", 1)[0]
-                    codes[c] = codes.get(c, 0) + 1
+                codes = Counter(f.split(" ", 1)[0] for f in files)
                 desc = ", ".join(f"{c}:{n}" for c, n in sorted(codes.items()))
                 result.append(f"  {dir_name}/ ({len(files)} files: {desc})")
             else:
@@ -215,7 +236,7 @@ class GitProcessor(Processor):
                     lockfile_summaries.append(f"diff --git {current_file}")
                     lockfile_summaries.append(f"  (lockfile changed, {current_file_lines} lines)")
                 # Detect new file
-                m = re.match(r"^diff --git a/(.+?) b/", line)
+                m = _DIFF_HEADER_RE.match(line)
                 filename = m.group(1).rsplit("/", 1)[-1] if m else ""
                 in_lockfile = filename in self._LOCK_FILES
                 if in_lockfile:
@@ -258,7 +279,7 @@ class GitProcessor(Processor):
             if not stripped:
                 continue
             # --name-status: "M\tpath/file" or "M  path/file"
-            m = re.match(r"^([MADRCTU])\d*\s+(.+)$", stripped)
+            m = _NAME_STATUS_RE.match(stripped)
             if m:
                 filepath = m.group(2)
             else:
@@ -280,7 +301,7 @@ class GitProcessor(Processor):
     def _process_diff_stat(self, lines: list[str]) -> str:
         """Compress `git diff --stat` output: strip visual bars, group when many files."""
         # Count stat lines (exclude summary line)
-        stat_lines = [line for line in lines if re.match(r"^\s*.+?\s+\|\s+\d+", line)]
+        stat_lines = [line for line in lines if _STAT_LINE_RE.match(line)]
 
         if len(stat_lines) > 20:
             return self._group_stat_by_dir(lines)
@@ -288,7 +309,7 @@ class GitProcessor(Processor):
         result = []
         for line in lines:
             # Match stat lines: " path/file | 5 ++-" -> " path/file | 5"
-            m = re.match(r"^(\s*.+?\s+\|\s+\d+)\s+[+\-]+\s*$", line)
+            m = _STAT_WITH_BARS_RE.match(line)
             if m:
                 result.append(m.group(1))
             else:
@@ -303,11 +324,11 @@ class GitProcessor(Processor):
         for line in lines:
             stripped = line.strip()
             # Summary line: "N files changed, X insertions(+), Y deletions(-)"
-            if re.match(r"\s*\d+ files? changed", stripped):
+            if _STAT_SUMMARY_RE.match(stripped):
                 summary_line = stripped
                 continue
             # Stat line: " path/to/file.py | 42 +++---"
-            m = re.match(r"^\s*(.+?)\s+\|\s+(.+)$", stripped)
+            m = _STAT_SPLIT_RE.match(stripped)
             if m:
                 filepath = m.group(1).strip()
                 stats = m.group(2).strip()
@@ -322,13 +343,14 @@ class GitProcessor(Processor):
         for dir_name, files in sorted(by_dir.items(), key=lambda x: -len(x[1])):
             if len(files) > 5:
                 total_changes = sum(
-                    int(s.group(1)) for _, stats in files if (s := re.search(r"(\d+)", stats))
+                    int(s.group(1)) for _, stats in files if (s := _FIRST_NUMBER_RE.search(stats))
                 )
                 result.append(f" {dir_name}/ ({len(files)} files, ~{total_changes} changes)")
             else:
                 for filepath, stats in files:
-                    # Strip +/- visual bars from stats
-                    clean_stats = re.sub(r"\s+[+\-]+\s*$", "", stats)
+                    # Strip trailing +/- visual bars from stats; a right-strip
+                    # leaves binary entries ("Bin 0 -> 12 bytes") intact
+                    clean_stats = stats.rstrip("+- ")
                     result.append(f" {filepath} | {clean_stats}")
 
         if summary_line:
@@ -337,28 +359,29 @@ class GitProcessor(Processor):
 
     def _process_log(self, output: str, command: str = "") -> str:
         max_entries = config.get("max_log_entries")
-        lines = output.splitlines()
+        total_lines = count_lines(output)
 
         # Detect --graph format (ASCII art: |, *, /, \)
         # Only match lines that contain graph chars (not just spaces)
-        has_graph = re.search(r"--graph\b", command) or (
-            lines and any(re.match(r"^[|*/\\ ]*[|*/\\]", line) for line in lines[:10])
+        has_graph = re.search(r"--graph\b", command) or any(
+            _LOG_GRAPH_RE.match(line) for line in head_lines(output, 10).splitlines()
         )
         if has_graph:
             # Graph format: truncate but preserve structure
-            if len(lines) > max_entries * 4:
-                kept = lines[: max_entries * 4]
-                kept.append(f"... ({len(lines) - max_entries * 4} more lines)")
-                return "\n".join(kept)
+            if total_lines > max_entries * 4:
+                kept = head_lines(output, max_entries * 4)
+                return f"{kept}\n... ({total_lines - max_entries * 4} more lines)"
             return output
 
         # Detect if already one-line format
-        if lines and not lines[0].startswith("commit "):
+        if output and not output.startswith("commit "):
             # Already compact format -- just truncate
-            if len(lines) > max_entries:
-                return "\n".join(lines[:max_entries]) + f"\n... ({len(lines) - max_entries} more)"
+            if total_lines > max_entries:
+                kept = head_lines(output, max_entries)
+                return f"{kept}\n... ({total_lines - max_entries} more)"
             return output
 
+        lines = output.splitlines()
         entries = []
         current: list[str] = []
         for line in lines:
@@ -424,13 +447,9 @@ class GitProcessor(Processor):
             stripped = line.strip()
             if not stripped:
                 continue
-            if re.match(
-                r"^(Receiving|Resolving|Counting|Compressing|"
-                r"remote:\s*(Counting|Compressing|Total|Enumerating))",
-                stripped,
-            ):
+            if _TRANSFER_NOISE_RE.match(stripped):
                 continue
-            if re.search(r"\d+%", stripped):
+            if _PERCENT_RE.search(stripped):
                 continue
             important.append(stripped)
 
@@ -443,40 +462,46 @@ class GitProcessor(Processor):
         return output
 
     def _process_branch(self, output: str) -> str:
-        lines = output.strip().splitlines()
+        text = output.strip()
         threshold = config.get("git_branch_threshold")
-        if len(lines) <= threshold:
+        if count_lines(text) <= threshold:
             return output
         current = ""
-        branches = []
-        for line in lines:
+        other_count = 0
+        # Only the first few other branches are shown, so the rest are counted
+        # rather than collected
+        shown: list[str] = []
+        for line in text.splitlines():
             stripped = line.strip()
             if stripped.startswith("* "):
                 current = stripped
             else:
-                branches.append(stripped)
+                other_count += 1
+                if len(shown) < 5:
+                    shown.append(f"  {stripped}")
         result = [current] if current else []
-        result.append(f"({len(branches)} other branches)")
-        # Show first few
-        for b in branches[:5]:
-            result.append(f"  {b}")
-        if len(branches) > 5:
-            result.append(f"  ... ({len(branches) - 5} more)")
+        result.append(f"({other_count} other branches)")
+        result.extend(shown)
+        if other_count > 5:
+            result.append(f"  ... ({other_count - 5} more)")
         return "\n".join(result)
 
     def _process_stash_list(self, output: str) -> str:
-        lines = output.strip().splitlines()
+        stripped = output.strip()
+        total_lines = count_lines(stripped)
         threshold = config.get("git_stash_threshold")
-        if len(lines) <= threshold:
+        if total_lines <= threshold:
             return output
-        return "\n".join(lines[:threshold]) + f"\n... ({len(lines) - threshold} more stashes)"
+        return f"{head_lines(stripped, threshold)}\n... ({total_lines - threshold} more stashes)"
 
     def _process_reflog(self, output: str) -> str:
-        lines = output.strip().splitlines()
+        stripped = output.strip()
+        total_lines = count_lines(stripped)
         max_entries = config.get("max_log_entries")
-        if len(lines) <= max_entries:
+        if total_lines <= max_entries:
             return output
-        return "\n".join(lines[:max_entries]) + f"\n... ({len(lines) - max_entries} more entries)"
+        kept = head_lines(stripped, max_entries)
+        return f"{kept}\n... ({total_lines - max_entries} more entries)"
 
     def _process_remote(self, output: str) -> str:
         """Compress git remote -v: deduplicate fetch/push lines."""
@@ -489,7 +514,7 @@ class GitProcessor(Processor):
             stripped = line.strip()
             # git remote -v shows "name\turl (fetch)" and "name\turl (push)"
             # Deduplicate by keeping only the first occurrence per name+url
-            key = re.sub(r"\s+\((fetch|push)\)\s*$", "", stripped)
+            key = _FETCH_PUSH_SUFFIX_RE.sub("", stripped)
             if key not in seen:
                 seen.add(key)
                 result.append(stripped)
@@ -503,21 +528,8 @@ class GitProcessor(Processor):
         if len(lines) <= 20:
             return output
 
-        by_author: dict[str, int] = {}
-        recent_lines: list[str] = []
-
-        for line in lines:
-            # Standard blame format: hash (Author YYYY-MM-DD HH:MM:SS +TZ  linenum) content
-            m = re.match(r"^[0-9a-f]+\s+\((.+?)\s+\d{4}-\d{2}-\d{2}\s+", line)
-            if m:
-                author = m.group(1).strip()
-                by_author[author] = by_author.get(author, 0) + 1
-            # Short blame: ^hash (Author date linenum)
-            elif re.match(r"^\^?[0-9a-f]+\s+\(", line):
-                m2 = re.match(r"^\^?[0-9a-f]+\s+\((.+?)\s+\d{4}", line)
-                if m2:
-                    author = m2.group(1).strip()
-                    by_author[author] = by_author.get(author, 0) + 1
+        matches = (_BLAME_RE.match(line) or _BLAME_SHORT_RE.match(line) for line in lines)
+        by_author = Counter(m.group(1).strip() for m in matches if m)
 
         if not by_author:
             # Porcelain or unrecognized format -- truncate
@@ -529,7 +541,7 @@ class GitProcessor(Processor):
         recent_lines = lines[-10:]
 
         result = [f"{len(lines)} lines, {len(by_author)} authors:"]
-        for author, count in sorted(by_author.items(), key=lambda x: -x[1]):
+        for author, count in by_author.most_common():
             pct = count * 100 // len(lines)
             result.append(f"  {author}: {count} lines ({pct}%)")
 
@@ -20,6 +20,16 @@ _KUBECTL_CMD_RE = re.compile(rf"\b(kubectl|oc)\s+{_KUBECTL_OPTS}{_KUBECTL_SUBCMD
 
 # Regex to detect "all containers ready": e.g. 1/1, 2/2, 3/3, 10/10
 _READY_RE = re.compile(r"\b(\d+)/(\d+)\b")
+_RUNNING_RE = re.compile(r"\bRunning\b")
+_COMPLETED_RE = re.compile(r"\bCompleted\b")
+_DESCRIBE_KEY_RE = re.compile(r"^[A-Z][\w\s-]+:")
+_EVENTS_HEADER_RE = re.compile(r"^\s*Type\s+Reason")
+_CONTAINER_STATE_RE = re.compile(r"(State|Last State|Restart Count|Exit Code|Reason|Ready|Image):")
+_MUTATE_RESULT_RE = re.compile(
+    r"\b(created|configured|unchanged|deleted|patched)\b"
+    r"|\b(error|Error|ERROR|warning|Warning)\b"
+    r"|\d+\s+resource"
+)
 
 
 class KubectlProcessor(Processor):
@@ -118,8 +128,8 @@ class KubectlProcessor(Processor):
             if not stripped:
                 continue
             # Running + all containers ready = healthy
-            is_running = re.search(r"\bRunning\b", line)
-            is_completed = re.search(r"\bCompleted\b", line)
+            is_running = _RUNNING_RE.search(line)
+            is_completed = _COMPLETED_RE.search(line)
             all_ready = self._is_all_ready(line)
 
             if (is_running and all_ready) or is_completed:
@@ -185,7 +195,7 @@ class KubectlProcessor(Processor):
             stripped = line.strip()
 
             # Top-level key-value lines (no leading whitespace, key: value)
-            if re.match(r"^[A-Z][\w\s-]+:", line) and not line.startswith((" ", "\t")):
+            if _DESCRIBE_KEY_RE.match(line) and not line.startswith((" ", "\t")):
                 key = line.split(":")[0].strip().lower()
 
                 # Check if this starts a noise section
@@ -209,7 +219,7 @@ class KubectlProcessor(Processor):
             if current_section == "events":
                 if "Warning" in line or "Error" in line or "Failed" in line:
                     result.append(line)
-                elif re.match(r"^\s*Type\s+Reason", stripped):
+                elif _EVENTS_HEADER_RE.match(stripped):
                     result.append(line)  # Keep header
                 elif "Normal" in line:
                     continue
@@ -218,9 +228,7 @@ class KubectlProcessor(Processor):
                 continue
 
             # Container state info
-            if re.search(
-                r"(State|Last State|Restart Count|Exit Code|Reason|Ready|Image):", stripped
-            ):
+            if _CONTAINER_STATE_RE.search(stripped):
                 result.append(line)
                 continue
 
@@ -256,11 +264,7 @@ class KubectlProcessor(Processor):
         for line in lines:
             stripped = line.strip()
             # Resource mutation results, errors, warnings, summaries
-            if (
-                re.search(r"\b(created|configured|unchanged|deleted|patched)\b", stripped)
-                or re.search(r"\b(error|Error|ERROR|warning|Warning)\b", stripped)
-                or re.search(r"\d+\s+resource", stripped)
-            ):
+            if _MUTATE_RESULT_RE.search(stripped):
                 result.append(stripped)
 
         if not result:
@@ -6,6 +6,47 @@ from collections import defaultdict
 from .. import config
 from .base import PYTHON_CMD, Processor
 
+_LINT_CMD_RE = re.compile(
+    r"\b(eslint|ruff(\s+check)?|flake8|pylint|clippy|rubocop|"
+    r"golangci-lint|stylelint|prettier\s+--check|biome\s+(check|lint)|"
+    rf"{PYTHON_CMD}\s+-m\s+(flake8|pylint|ruff|mypy)|mypy|"
+    r"shellcheck|hadolint|tflint|ktlint|swiftlint|cargo\s+clippy|"
+    r"oxlint|deno\s+lint|"
+    r"npx\s+(eslint|prettier|stylelint|biome)|"
+    r"poetry\s+run\s+(flake8|pylint|ruff|mypy)|"
+    r"uv\s+run\s+(flake8|pylint|ruff|mypy|ruff\s+check)|"
+    r"bundle\s+exec\s+rubocop)\b"
+)
+
+# ESLint block-format file header: a bare path with no line/column suffix
+_FILE_HEADER_RE = re.compile(r"^/?[\w./_-]+\.\w+$")
+
+_SUMMARY_COUNT_RE = re.compile(r"^\s*\d+\s+(error|warning|problem)")
+_SUMMARY_TOTAL_RE = re.compile(r"(Found|Total|All checks)\s+\d+")
+_SUMMARY_LEVEL_RE = re.compile(r"^(error|warning):")
+_SUMMARY_ESLINT_RE = re.compile(r"^\s*✖\s+\d+\s+problem")
+_IMPORTANT_RE = re.compile(r"\b(error|fatal|cannot|failed)\b", re.I)
+
+# Violation line formats, tried in order by _parse_violation. File paths
+# exclude ':' (apart from an optional drive letter) so a failed match costs a
+# single attempt from the line start instead of one per colon in the line.
+_PATH = r"((?:[A-Za-z]:)?[^:]+)"
+_ESLINT_BLOCK_RE = re.compile(r"^\s*\d+:\d+\s+(?:error|warning)\s+.+?\s{2,}(\S+)\s*$")
+_ESLINT_INLINE_RE = re.compile(rf"^{_PATH}:\d+:\d+:\s+.+\((\S+)\)\s*$")
+_ESLINT_INLINE_ALT_RE = re.compile(rf"^{_PATH}:\d+:\d+\s+(?:error|warning)\s+.+?\s{{2,}}(\S+)\s*$")
+_RUFF_RE = re.compile(rf"^{_PATH}:\d+:\d+:\s+([A-Z]\w?\d+)\s+")
+_PYLINT_RE = re.compile(rf"^{_PATH}:\d+:\d+:\s+\w+:\s+.+\((\S+)\)\s*$")
+_MYPY_RE = re.compile(rf"^{_PATH}:\d+(?::\d+)?:\s+(?:error|warning|note):\s+.+\[(\S+)\]\s*$")
+_CLIPPY_RE = re.compile(r"^(?:warning|error)\[(\S+)\]")
+# Lowercase rule names only, so summary brackets like [1 warning] never match
+_CLIPPY_FALLBACK_RE = re.compile(r"^(?:warning|error):.*\[([a-z][a-z0-9_-]+)\]\s*$")
+_SHELLCHECK_BLOCK_RE = re.compile(r"^In (.+?) line \d+:")
+_SHELLCHECK_GCC_RE = re.compile(rf"^{_PATH}:\d+:\d+:\s+(?:warning|error|info|style)\s*-\s*(SC\d+)")
+_HADOLINT_RE = re.compile(rf"^{_PATH}:\d+(?::\d+)?\s+(DL\d+|SC\d+)\s+")
+_BIOME_RE = re.compile(rf"^{_PATH}:\d+:\d+\s+(lint/\S+)\s+")
+_GOLANGCI_RE = re.compile(r"^((?:[A-Za-z]:)?[^:]+\.go):\d+:\d+:\s+.+\(([a-zA-Z][\w-]*)\)\s*$")
+_RUBOCOP_RE = re.compile(r"^((?:[A-Za-z]:)?[^:]+\.rb):\d+:\d+:\s+[CWEFR]:\s+(\S+?):\s+")
+
 
 class LintOutputProcessor(Processor):
     priority = 27
@@ -22,20 +63,7 @@ class LintOutputProcessor(Processor):
         return "lint"
 
     def can_handle(self, command: str) -> bool:
-        return bool(
-            re.search(
-                r"\b(eslint|ruff(\s+check)?|flake8|pylint|clippy|rubocop|"
-                r"golangci-lint|stylelint|prettier\s+--check|biome\s+(check|lint)|"
-                rf"{PYTHON_CMD}\s+-m\s+(flake8|pylint|ruff|mypy)|mypy|"
-                r"shellcheck|hadolint|tflint|ktlint|swiftlint|cargo\s+clippy|"
-                r"oxlint|deno\s+lint|"
-                r"npx\s+(eslint|prettier|stylelint|biome)|"
-                r"poetry\s+run\s+(flake8|pylint|ruff|mypy)|"
-                r"uv\s+run\s+(flake8|pylint|ruff|mypy|ruff\s+check)|"
-                r"bundle\s+exec\s+rubocop)\b",
-                command,
-            )
-        )
+        return bool(_LINT_CMD_RE.search(command))
 
     def process(self, command: str, output: str) -> str:
         if not output or not output.strip():
@@ -54,22 +82,25 @@ class LintOutputProcessor(Processor):
             if not stripped:
                 continue
 
-            # Detect ESLint file header line (path without colon/digits -- not a violation)
-            if re.match(r"^/?[\w./_-]+\.\w+$", stripped) and not re.search(r":\d+", stripped):
-                current_file = stripped
-                continue
-
-            parsed = self._parse_violation(stripped, current_file)
+            # Every violation format contains a colon; a line without one is
+            # at most an ESLint file header, so skip the per-format regexes.
+            if ":" not in stripped:
+                if _FILE_HEADER_RE.match(stripped):
+                    current_file = stripped
+                    continue
+                parsed = None
+            else:
+                parsed = self._parse_violation(stripped, current_file)
             if parsed:
                 rule, filepath = parsed
                 violations_by_rule[rule].append(stripped)
                 if filepath:
                     files_by_rule[rule].add(filepath)
             elif (
-                re.match(r"^\s*\d+\s+(error|warning|problem)", stripped)
-                or re.search(r"(Found|Total|All checks)\s+\d+", stripped)
-                or re.match(r"^(error|warning):", stripped.lower())
-                or re.match(r"^\s*✖\s+\d+\s+problem", stripped)
+                _SUMMARY_COUNT_RE.match(stripped)
+                or _SUMMARY_TOTAL_RE.search(stripped)
+                or _SUMMARY_LEVEL_RE.match(stripped.lower())
+                or _SUMMARY_ESLINT_RE.match(stripped)
             ):
                 summary_lines.append(stripped)
             else:
@@ -104,9 +135,7 @@ class LintOutputProcessor(Processor):
             result.extend(summary_lines)
 
         # Include ungrouped lines that might be important (errors, not just noise)
-        important_ungrouped = [
-            line for line in ungrouped if re.search(r"\b(error|fatal|cannot|failed)\b", line, re.I)
-        ]
+        important_ungrouped = [line for line in ungrouped if _IMPORTANT_RE.search(line)]
         if important_ungrouped:
             result.extend(important_ungrouped[:5])
 
@@ -116,72 +145,82 @@ class LintOutputProcessor(Processor):
         """Extract (rule_id, filepath) from a lint violation line."""
 
         # ESLint indented format:  10:5  error  Unexpected var  no-var
-        m = re.match(r"^\s*(\d+):(\d+)\s+(error|warning)\s+(.+?)\s{2,}(\S+)\s*$", line)
+        m = _ESLINT_BLOCK_RE.match(line)
         if m:
-            return m.group(5), current_file
+            return m.group(1), current_file
 
-        # ESLint inline: /path/file.js:10:5: 'foo' is not defined. (no-undef)
-        m = re.match(r"^(.+?):(\d+):\d+:\s+.+\((\S+)\)\s*$", line)
-        if m:
-            return m.group(3), m.group(1)
+        # Cheap substring gates below skip formats whose literal markers
+        # are absent, so most lines only reach one or two regexes.
+        if "(" in line:
+            # ESLint inline: /path/file.js:10:5: 'foo' is not defined. (no-undef)
+            m = _ESLINT_INLINE_RE.match(line)
+            if m:
+                return m.group(2), m.group(1)
 
         # ESLint inline alt: /path/file.js:10:5  error  message  rule-name
-        m = re.match(r"^(.+?):(\d+):\d+\s+(error|warning)\s+.+?\s{2,}(\S+)\s*$", line)
+        m = _ESLINT_INLINE_ALT_RE.match(line)
         if m:
-            return m.group(4), m.group(1)
+            return m.group(2), m.group(1)
 
         # Ruff/Flake8: path/file.py:10:5: E501 line too long
-        m = re.match(r"^(.+?):(\d+):\d+:\s+([A-Z]\w?\d+)\s+", line)
+        m = _RUFF_RE.match(line)
         if m:
-            return m.group(3), m.group(1)
-
-        # Pylint: path/file.py:10:0: C0114: message (rule-name)
-        m = re.match(r"^(.+?):(\d+):\d+:\s+\w+:\s+.+\((\S+)\)\s*$", line)
-        if m:
-            return m.group(3), m.group(1)
-
-        # mypy: file.py:10: error: message  [error-code]
-        m = re.match(r"^(.+?):(\d+):\s+(error|warning|note):\s+.+\[(\S+)\]\s*$", line)
-        if m:
-            return m.group(4), m.group(1)
-
-        # Clippy: warning[rule]: message
-        m = re.match(r"^(warning|error)\[(\S+)\]", line)
-        if m:
-            return m.group(2), ""
-
-        # Clippy/Rust fallback: warning: message [rule-name]
-        # Exclude summary brackets like [1 warning], [3 errors]
-        m = re.search(r"\[([a-z][a-z0-9_-]+)\]\s*$", line)
-        if m and re.match(r"^(warning|error):", line):
-            return m.group(1), ""
+            return m.group(2), m.group(1)
+
+        if "(" in line:
+            # Pylint: path/file.py:10:0: C0114: message (rule-name)
+            m = _PYLINT_RE.match(line)
+            if m:
+                return m.group(2), m.group(1)
+
+        if "[" in line:
+            # mypy: file.py:10[:5]: error: message  [error-code]
+            m = _MYPY_RE.match(line)
+            if m:
+                return m.group(2), m.group(1)
+
+            # Clippy: warning[rule]: message
+            m = _CLIPPY_RE.match(line)
+            if m:
+                return m.group(1), ""
+
+            # Clippy/Rust fallback: warning: message [rule-name]
+            m = _CLIPPY_FALLBACK_RE.match(line)
+            if m:
+                return m.group(1), ""
 
         # shellcheck: In file.sh line N: SC2086 ...
-        m = re.match(r"^In (.+?) line (\d+):", line)
-        if m:
-            return "shellcheck", m.group(1)
-        m = re.match(r"^(.+?):(\d+):\d+:\s+(warning|error|info|style)\s*-\s*(SC\d+)", line)
-        if m:
-            return m.group(4), m.group(1)
-
-        # hadolint: file:line DL3008 ...
-        m = re.match(r"^(.+?):(\d+)\s+(DL\d+|SC\d+)\s+", line)
-        if m:
-            return m.group(3), m.group(1)
+        if line.startswith("In "):
+            m = _SHELLCHECK_BLOCK_RE.match(line)
+            if m:
+                return "shellcheck", m.group(1)
+        if "SC" in line:
+            m = _SHELLCHECK_GCC_RE.match(line)
+            if m:
+                return m.group(2), m.group(1)
+
+        # hadolint: file:line[:col] DL3008 ...
+        if "DL" in line or "SC" in line:
+            m = _HADOLINT_RE.match(line)
+            if m:
+                return m.group(2), m.group(1)
 
         # biome: file.ts:10:5 lint/rule message
-        m = re.match(r"^(.+?):(\d+):\d+\s+(lint/\S+)\s+", line)
-        if m:
-            return m.group(3), m.group(1)
+        if "lint/" in line:
+            m = _BIOME_RE.match(line)
+            if m:
+                return m.group(2), m.group(1)
 
         # golangci-lint: file.go:10:5: message (linter-name)
-        m = re.match(r"^(.+?\.go):(\d+):\d+:\s+.+\(([a-zA-Z][\w-]*)\)\s*$", line)
-        if m:
-            return m.group(3), m.group(1)
+        if ".go:" in line:
+            m = _GOLANGCI_RE.match(line)
+            if m:
+                return m.group(2), m.group(1)
 
         # rubocop: file.rb:10:5: C: Rule/Name: message
-        m = re.match(r"^(.+?\.rb):(\d+):\d+:\s+[CWEFR]:\s+(\S+?):\s+", line)
-        if m:
-            return m.group(3), m.group(1)
+        if ".rb:" in line:
+            m = _RUBOCOP_RE.match(line)
+            if m:
+                return m.group(2), m.group(1)
 
         return None
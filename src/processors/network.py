@@ -4,7 +4,54 @@ import json
 import re
 
 from .base import Processor
-from .utils import compress_json_value
+from .utils import compress_json_value, count_lines
+
+# Verbose curl "*" info lines that are pure TLS/connection noise
+_CURL_NOISE_RE = re.compile(
+    r"^\*\s*(SSL|TLS|ALPN|CAfile|CApath|Certificate|issuer|subject|"
+    r"subjectAlt|Server certificate|Connected|Trying|"
+    r"Connection(ed| #\d)| *expire| *start|"
+    r"TCP_NODELAY|Mark bundle|upload completely|"
+    r"Using Stream|old SSL|Closing|"
+    r"successfully set certificate)\b"
+)
+_REQUEST_LINE_RE = re.compile(r"^(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)\s+")
+_CURL_ERROR_RE = re.compile(r"(error|fail|could not|refused)", re.I)
+_PROGRESS_HEADER_RE = re.compile(r"%\s+Total\s+%\s+Received")
+_PROGRESS_SUBHEADER_RE = re.compile(r"Dload\s+Upload")
+_PROGRESS_ROW_RE = re.compile(r"^\s*\d+\s+\d+")
+_PROGRESS_TIME_RE = re.compile(r"--:--:--|(\d+:){2}\d+")
+_WGET_USEFUL_RE = re.compile(
+    r"^(Length:|Saving to:|Location:|HTTP request sent|--\d{4})"
+    r"|^\d{3}\s"
+    r"|\b(saved|ERROR|error|failed|refused|not found)\b",
+    re.I,
+)
+_HTTPIE_HEADER_RE = re.compile(r"^[\w-]+:")
+
+# Lowercased header-name prefixes worth keeping, as tuples so a single
+# str.startswith() call tests them all
+_CURL_IMPORTANT_HEADERS = (
+    "content-type",
+    "location",
+    "www-authenticate",
+    "set-cookie",
+    "x-ratelimit",
+    "retry-after",
+    "authorization",
+    "content-length",
+    "transfer-encoding",
+    "access-control-allow-origin",
+    "x-request-id",
+)
+_HTTPIE_IMPORTANT_HEADERS = (
+    "content-type",
+    "location",
+    "set-cookie",
+    "www-authenticate",
+    "content-length",
+    "x-request-id",
+)
 
 
 class NetworkProcessor(Processor):
@@ -48,43 +95,31 @@ class NetworkProcessor(Processor):
         # Verbose curl: strip TLS, connection, boilerplate headers
         result = []
 
-        # Headers worth keeping in the response
-        important_headers = {
-            "content-type",
-            "location",
-            "www-authenticate",
-            "set-cookie",
-            "x-ratelimit",
-            "retry-after",
-            "authorization",
-            "content-length",
-            "transfer-encoding",
-            "access-control-allow-origin",
-            "x-request-id",
-        }
-
         body_lines = []
         in_body = False
+        in_progress_table = False
 
         for line in lines:
             stripped = line.strip()
 
+            # Progress meter table: "% Total % Received" header, then the
+            # "Dload Upload" sub-header directly below it
+            if _PROGRESS_HEADER_RE.search(stripped):
+                in_progress_table = True
+                continue
+            if in_progress_table and _PROGRESS_SUBHEADER_RE.search(stripped):
+                in_progress_table = False
+                continue
+            in_progress_table = False
+
             # TLS/SSL handshake noise
-            if re.match(
-                r"^\*\s*(SSL|TLS|ALPN|CAfile|CApath|Certificate|issuer|subject|"
-                r"subjectAlt|Server certificate|Connected|Trying|"
-                r"Connection(ed| #\d)| *expire| *start|"
-                r"TCP_NODELAY|Mark bundle|upload completely|"
-                r"Using Stream|old SSL|Closing|"
-                r"successfully set certificate)\b",
-                stripped,
-            ):
+            if stripped.startswith("*") and _CURL_NOISE_RE.match(stripped):
                 continue
 
             # Request headers (> prefix) -- keep only the method line
             if stripped.startswith("> "):
                 header_content = stripped[2:].strip()
-                if re.match(r"^(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)\s+", header_content):
+                if _REQUEST_LINE_RE.match(header_content):
                     result.append(stripped)
                 continue
 
@@ -92,7 +127,7 @@ class NetworkProcessor(Processor):
             if stripped.startswith("< "):
                 header_content = stripped[2:].strip()
                 # Status line: always keep
-                if re.match(r"^HTTP/", header_content):
+                if header_content.startswith("HTTP/"):
                     result.append(stripped)
                     continue
                 # Empty header line marks end of headers, body starts
@@ -101,22 +136,16 @@ class NetworkProcessor(Processor):
                     continue
                 # Check if header is important
                 header_lower = header_content.split(":")[0].lower() if ":" in header_content else ""
-                if any(header_lower.startswith(h) for h in important_headers):
+                if header_lower.startswith(_CURL_IMPORTANT_HEADERS):
                     result.append(stripped)
                 continue
 
-            # Progress meter table (% Total % Received)
-            if re.match(r"^\s+%\s+Total\s+%\s+Received", stripped):
-                continue
-            if re.match(r"^\s*\d+\s+\d+", stripped) and re.search(
-                r"--:--:--|(\d+:){2}\d+", stripped
-            ):
+            # Progress meter rows
+            if _PROGRESS_ROW_RE.match(stripped) and _PROGRESS_TIME_RE.search(stripped):
                 continue
 
             # Info lines with * prefix -- keep only errors
-            if stripped.startswith("* ") and not re.search(
-                r"(error|fail|could not|refused)", stripped, re.I
-            ):
+            if stripped.startswith("* ") and not _CURL_ERROR_RE.search(stripped):
                 continue
 
             # Keep everything else (response body)
@@ -140,16 +169,14 @@ class NetworkProcessor(Processor):
         for line in lines:
             stripped = line.strip()
             # Progress table header
-            if re.search(r"%\s+Total\s+%\s+Received", stripped):
+            if _PROGRESS_HEADER_RE.search(stripped):
                 in_progress_table = True
                 continue
             # Second header line (Dload/Upload columns)
-            if in_progress_table and re.search(r"Dload\s+Upload", stripped):
+            if in_progress_table and _PROGRESS_SUBHEADER_RE.search(stripped):
                 continue
             # Progress data lines (numbers with time patterns)
-            if re.match(r"^\s*\d+\s+\d+", stripped) and re.search(
-                r"--:--:--|(\d+:){2}\d+", stripped
-            ):
+            if _PROGRESS_ROW_RE.match(stripped) and _PROGRESS_TIME_RE.search(stripped):
                 in_progress_table = False
                 continue
             in_progress_table = False
@@ -162,35 +189,29 @@ class NetworkProcessor(Processor):
         if not stripped or (not stripped.startswith(("{", "["))):
             return text
 
+        # Only compress if the JSON is large; checked before parsing so
+        # small bodies are never decoded
+        if len(stripped) < 1500:
+            return text
+
         try:
             data = json.loads(stripped)
         except (json.JSONDecodeError, ValueError):
             return text
 
-        # Only compress if the JSON is large
-        if len(stripped) < 1500:
-            return text
-
         compressed = compress_json_value(data, max_depth=2)
         summary = json.dumps(compressed, indent=2, default=str)
-        return f"{summary}\n\n({len(stripped)} chars, {len(text.splitlines())} lines)"
+        return f"{summary}\n\n({len(stripped)} chars, {count_lines(text)} lines)"
 
     def _process_wget(self, output: str) -> str:
         lines = output.splitlines()
         result = []
 
-        _useful_re = re.compile(
-            r"^(Length:|Saving to:|Location:|HTTP request sent|--\d{4})"
-            r"|^\d{3}\s"
-            r"|\b(saved|ERROR|error|failed|refused|not found)\b",
-            re.I,
-        )
-
         for line in lines:
             stripped = line.strip()
             if not stripped:
                 continue
-            if _useful_re.search(stripped):
+            if _WGET_USEFUL_RE.search(stripped):
                 result.append(stripped)
 
         return "\n".join(result) if result else output
@@ -206,23 +227,15 @@ class NetworkProcessor(Processor):
             stripped = line.strip()
 
             # Status line: HTTP/1.1 200 OK
-            if re.match(r"^HTTP/", stripped):
+            if stripped.startswith("HTTP/"):
                 result.append(line)
                 continue
 
             # Headers (key: value format before body)
-            if not in_body and re.match(r"^[\w-]+:", stripped):
+            if not in_body and _HTTPIE_HEADER_RE.match(stripped):
                 header_name = stripped.split(":")[0].lower()
                 # Keep important headers
-                important = {
-                    "content-type",
-                    "location",
-                    "set-cookie",
-                    "www-authenticate",
-                    "content-length",
-                    "x-request-id",
-                }
-                if any(header_name.startswith(h) for h in important):
+                if header_name.startswith(_HTTPIE_IMPORTANT_HEADERS):
                     result.append(line)
                 continue
 
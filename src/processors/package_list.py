@@ -4,6 +4,13 @@ import re
 
 from .base import Processor
 
+# pip list column header and its dashed separator
+_PIP_HEADER_RE = re.compile(r"^-+\s+-+|^Package\s+Version")
+_NPM_ISSUE_RE = re.compile(r"(UNMET|invalid|missing|ERR!|WARN)", re.I)
+# npm ls tree: first-level entries, then any deeper entry (unicode or ASCII art)
+_NPM_TOP_LEVEL_RE = re.compile(r"^[├└]──\s+|^[+`]-\s+")
+_NPM_NESTED_RE = re.compile(r"^[│ ]*[├└]|^[| ]*[+`]")
+
 
 class PackageListProcessor(Processor):
     priority = 15
@@ -52,9 +59,7 @@ class PackageListProcessor(Processor):
         data_lines = []
         for line in lines:
             stripped = line.strip()
-            if re.match(r"^-+\s+-+", stripped):
-                continue
-            if re.match(r"^Package\s+Version", stripped):
+            if _PIP_HEADER_RE.match(stripped):
                 continue
             if stripped:
                 data_lines.append(stripped)
@@ -95,18 +100,18 @@ class PackageListProcessor(Processor):
             stripped = line.strip()
 
             # Unmet/invalid dependencies — always keep
-            if re.search(r"(UNMET|invalid|missing|ERR!|WARN)", stripped, re.I):
+            if _NPM_ISSUE_RE.search(stripped):
                 issues.append(stripped)
                 continue
 
             # Top-level: lines with only one level of tree indent (├── or └──)
-            if re.match(r"^[├└]──\s+", line) or re.match(r"^[+`]-\s+", line):
+            if _NPM_TOP_LEVEL_RE.match(line):
                 top_level.append(stripped)
                 total_deps += 1
                 continue
 
             # Deeper dependencies
-            if re.match(r"^[│ ]*[├└]", line) or re.match(r"^[| ]*[+`]", line):
+            if _NPM_NESTED_RE.match(line):
                 total_deps += 1
                 continue
 
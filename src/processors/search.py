@@ -1,11 +1,15 @@
 """Search output processor: grep -r, rg, ag, fd."""
 
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from .. import config
 from .base import Processor
 
+# file:line:content or file:content; extensionless files need a line number
+_FILE_MATCH_RE = re.compile(r"^((?:[a-zA-Z]:)?[^\s:]+\.[a-zA-Z0-9]+):(\d+:)?(.*)$")
+_EXTENSIONLESS_MATCH_RE = re.compile(r"^((?:[a-zA-Z]:)?[^\s:]+):(\d+:)(.*)$")
+
 
 class SearchProcessor(Processor):
     priority = 35
@@ -42,14 +46,14 @@ class SearchProcessor(Processor):
                 continue
 
             # Skip binary file warnings
-            if re.match(r"^Binary file .* matches", stripped):
+            if stripped.startswith("Binary file ") and stripped.find(" matches", 12) != -1:
                 continue
 
             # file:line:content or file:content
             # Accept extensionless files if a line number follows
-            m = re.match(r"^((?:[a-zA-Z]:)?[^\s:]+\.[a-zA-Z0-9]+):(\d+:)?(.*)$", stripped)
+            m = _FILE_MATCH_RE.match(stripped)
             if not m:
-                m = re.match(r"^((?:[a-zA-Z]:)?[^\s:]+):(\d+:)(.*)$", stripped)
+                m = _EXTENSIONLESS_MATCH_RE.match(stripped)
             if m:
                 filepath = m.group(1)
                 by_file[filepath].append(stripped)
@@ -177,13 +181,8 @@ class SearchProcessor(Processor):
         dirs = sorted(by_dir.items(), key=lambda x: -len(x[1]))
         for dir_path, files in dirs[:max_files]:
             if len(files) > 10:
-                exts: dict[str, int] = defaultdict(int)
-                for f in files:
-                    ext = f.rsplit(".", 1)[-1] if "." in f else "(none)"
-                    exts[ext] += 1
-                ext_desc = ", ".join(
-                    f"*.{e}:{n}" for e, n in sorted(exts.items(), key=lambda x: -x[1])[:4]
-                )
+                exts = Counter(f.rsplit(".", 1)[-1] if "." in f else "(none)" for f in files)
+                ext_desc = ", ".join(f"*.{e}:{n}" for e, n in exts.most_common(4))
                 result.append(f"  {dir_path}/ ({len(files)} files: {ext_desc})")
             elif len(files) > 5:
                 result.append(f"  {dir_path}/ ({len(files)} files): {', '.join(files[:3])} ...")
@@ -4,6 +4,13 @@ import re
 
 from .base import Processor
 
+_DU_LINE_RE = re.compile(r"^([\d.]+\s*[KMGTP]?i?B?)\s+(.+)$")
+_SIZE_VALUE_RE = re.compile(r"^([\d.]+)\s*([KMGTP])?")
+_SIZE_COLUMN_RE = re.compile(r"\bSize\b")
+_VIRTUAL_MOUNT_RE = re.compile(r"\b(snap|loop\d*|squashfs)\b")
+_TMPFS_RE = re.compile(r"^tmpfs\b")
+_DEVTMPFS_RE = re.compile(r"^devtmpfs\b")
+
 
 class SystemInfoProcessor(Processor):
     priority = 36
@@ -44,7 +51,7 @@ class SystemInfoProcessor(Processor):
             if not stripped:
                 continue
             # Detect total line (last line or "total" keyword)
-            m = re.match(r"^([\d.]+\s*[KMGTP]?i?B?)\s+(.+)$", stripped)
+            m = _DU_LINE_RE.match(stripped)
             if not m:
                 # Try tab-separated format
                 parts = stripped.split("\t")
@@ -65,7 +72,7 @@ class SystemInfoProcessor(Processor):
         def parse_size(size_str: str) -> float:
             s = size_str.strip()
             multipliers = {"K": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "P": 1e15}
-            m = re.match(r"^([\d.]+)\s*([KMGTP])?", s)
+            m = _SIZE_VALUE_RE.match(s)
             if m:
                 val = float(m.group(1))
                 if m.group(2):
@@ -139,7 +146,7 @@ class SystemInfoProcessor(Processor):
             return lines
         header = lines[0]
         # Find where "Size" starts — everything before is the Filesystem column
-        m = re.search(r"\bSize\b", header)
+        m = _SIZE_COLUMN_RE.search(header)
         if not m:
             return lines
         col_end = m.start()
@@ -156,14 +163,14 @@ class SystemInfoProcessor(Processor):
         for line in lines:
             stripped = line.strip()
             # Skip snap/loop mounts
-            if re.search(r"\b(snap|loop\d*|squashfs)\b", stripped):
+            if _VIRTUAL_MOUNT_RE.search(stripped):
                 continue
             # Skip tmpfs unless it's /tmp
-            if re.match(r"^tmpfs\b", stripped) and "/tmp" not in stripped:  # noqa: S108
+            if _TMPFS_RE.match(stripped) and "/tmp" not in stripped:  # noqa: S108
                 filtered_count += 1
                 continue
             # Skip devtmpfs
-            if re.match(r"^devtmpfs\b", stripped):
+            if _DEVTMPFS_RE.match(stripped):
                 filtered_count += 1
                 continue
             result.append(line)
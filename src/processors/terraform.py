@@ -8,6 +8,35 @@ _TF_CMD_RE = re.compile(
     r"\b(terraform|tofu)\s+(plan|apply|destroy|init|output|validate|fmt|state\s+(?:list|show))\b"
 )
 
+# Provider installation and backend setup chatter in plan/apply output
+_PLAN_INIT_NOISE_RE = re.compile(
+    r"^(Initializing|Acquiring|Installing|Reusing)\s+"
+    r"|^-\s+Installed\s+"
+    r"|^Successfully configured"
+)
+_RESOURCE_HEADER_RE = re.compile(r"^#\s+\S+")
+_RESOURCE_BOUNDARY_RE = re.compile(r"^\s*[+~-]\s+resource\s+")
+# Literal line prefixes, tested with a single str.startswith(tuple) call
+_CHANGE_PREFIXES = ("~", "+", "-")
+_PLAN_SUMMARY_PREFIXES = (
+    "Plan:",
+    "Apply complete",
+    "Destroy complete",
+    "No changes",
+    "Changes to Outputs:",
+)
+_OUTPUT_VALUE_RE = re.compile(r"^\s*[+~-]\s+\w+\s*=")
+_ERROR_WARNING_RE = re.compile(r"\b(Error|Warning|error|warning)\b")
+_PROVIDER_VERSION_RE = re.compile(r"^-\s+.*\bv\d+\.\d+")
+_INIT_SUCCESS_RE = re.compile(
+    r"(successfully initialized|has been successfully|Terraform has been)", re.I
+)
+_UPGRADE_NOTICE_RE = re.compile(r"(upgrade available|new version|rerun with -upgrade)", re.I)
+_OUTPUT_KEY_RE = re.compile(r"^(\S+\s*=\s*)")
+_STATE_ATTR_KEY_RE = re.compile(r"^(\s*\S+\s*=\s*)")
+_UNINDENTED_RE = re.compile(r"^\S")
+_RESOURCE_TYPE_RE = re.compile(r"^[a-z]+_")
+
 
 class TerraformProcessor(Processor):
     priority = 33
@@ -54,18 +83,12 @@ class TerraformProcessor(Processor):
         for line in lines:
             stripped = line.strip()
 
-            # Provider initialization -- skip
-            if re.match(r"^(Initializing|Acquiring|Installing|Reusing)\s+", stripped):
-                continue
-            if re.match(r"^-\s+Installed\s+", stripped):
-                continue
-
-            # Backend/state info -- skip
-            if re.match(r"^(Initializing the backend|Successfully configured)", stripped):
+            # Provider initialization, backend/state info -- skip
+            if _PLAN_INIT_NOISE_RE.match(stripped):
                 continue
 
             # Resource change header: # resource.name will be created/destroyed/updated
-            if re.match(r"^#\s+\S+", stripped) or re.match(r"^\s+#\s+\S+", stripped):
+            if _RESOURCE_HEADER_RE.match(stripped):
                 in_resource_block = True
                 resource_action = ""
                 result.append(line)
@@ -79,7 +102,7 @@ class TerraformProcessor(Processor):
                 continue
 
             # Resource block boundary
-            if in_resource_block and re.match(r"^\s*[+~-]\s+resource\s+", stripped):
+            if in_resource_block and _RESOURCE_BOUNDARY_RE.match(stripped):
                 result.append(line)
                 continue
             if in_resource_block and stripped == "}":
@@ -90,7 +113,7 @@ class TerraformProcessor(Processor):
             # Inside resource block -- filter attributes
             if in_resource_block:
                 # Changed attributes (lines with -> or ~ prefix)
-                if "->" in stripped or re.match(r"^\s*[~+-]", stripped):
+                if "->" in stripped or stripped.startswith(_CHANGE_PREFIXES):
                     result.append(line)
                     continue
 
@@ -116,31 +139,23 @@ class TerraformProcessor(Processor):
                 # For update (~), skip unchanged attributes
                 continue
 
-            # Plan/Apply summary lines -- always keep
-            if re.match(r"^Plan:", stripped):
-                result.append(line)
-                continue
-            if re.match(r"^(Apply complete|Destroy complete|No changes)", stripped):
-                result.append(line)
-                continue
-
-            # Changes to Outputs -- keep
-            if re.match(r"^Changes to Outputs:", stripped):
+            # Plan/Apply summary lines and "Changes to Outputs" -- always keep
+            if stripped.startswith(_PLAN_SUMMARY_PREFIXES):
                 result.append(line)
                 continue
 
             # Output values
-            if re.match(r"^\s*[+~-]\s+\w+\s*=", stripped):
+            if _OUTPUT_VALUE_RE.match(stripped):
                 result.append(line)
                 continue
 
             # Warnings and errors
-            if re.search(r"\b(Error|Warning|error|warning)\b", stripped):
+            if _ERROR_WARNING_RE.search(stripped):
                 result.append(line)
                 continue
 
             # "Note:" lines
-            if re.match(r"^Note:", stripped):
+            if stripped.startswith("Note:"):
                 result.append(line)
                 continue
 
@@ -161,32 +176,25 @@ class TerraformProcessor(Processor):
             stripped = line.strip()
 
             # Keep provider version info: "- Installed hashicorp/aws v5.31.0 ..."
-            if re.search(r"\bv\d+\.\d+", stripped) and re.match(r"^-\s+", stripped):
+            if _PROVIDER_VERSION_RE.match(stripped):
                 result.append(stripped)
                 continue
 
             # Keep final result
-            if re.search(
-                r"(successfully initialized|has been successfully|Terraform has been)",
-                stripped,
-                re.I,
-            ):
+            if _INIT_SUCCESS_RE.search(stripped):
                 result.append(stripped)
                 continue
 
             # Keep errors/warnings
-            if re.search(r"\b(Error|Warning|error|warning)\b", stripped):
+            if _ERROR_WARNING_RE.search(stripped):
                 result.append(stripped)
                 continue
 
             # Keep upgrade/reinitialization notices
-            if re.search(r"(upgrade available|new version|rerun with -upgrade)", stripped, re.I):
+            if _UPGRADE_NOTICE_RE.search(stripped):
                 result.append(stripped)
-                continue
 
-            # Skip verbose initialization messages
-            if re.match(r"^(Initializing|Acquiring|Installing|Reusing|Finding|Using)\s+", stripped):
-                continue
+            # Anything else (verbose initialization messages) is dropped
 
         if not result:
             return output
@@ -202,7 +210,7 @@ class TerraformProcessor(Processor):
         for line in lines:
             # Truncate very long output values
             if len(line) > 200:
-                key_match = re.match(r"^(\S+\s*=\s*)", line)
+                key_match = _OUTPUT_KEY_RE.match(line)
                 if key_match:
                     result.append(f"{key_match.group(1)}... ({len(line)} chars)")
                 else:
@@ -219,7 +227,7 @@ class TerraformProcessor(Processor):
             return output
 
         # state list: just resource names
-        if all(re.match(r"^\S", line) for line in lines if line.strip()):
+        if all(_UNINDENTED_RE.match(line) for line in lines if line.strip()):
             result = [f"{len(lines)} resources in state:"]
             # Group by resource type
             by_type: dict[str, int] = {}
@@ -230,7 +238,7 @@ class TerraformProcessor(Processor):
                 # Extract type: module.x.aws_instance.y -> aws_instance
                 parts = stripped.split(".")
                 for part in parts:
-                    if re.match(r"^[a-z]+_", part):
+                    if _RESOURCE_TYPE_RE.match(part):
                         by_type[part] = by_type.get(part, 0) + 1
                         break
                 else:
@@ -244,7 +252,7 @@ class TerraformProcessor(Processor):
         result = []
         for line in lines:
             if len(line) > 200:
-                key_match = re.match(r"^(\s*\S+\s*=\s*)", line)
+                key_match = _STATE_ATTR_KEY_RE.match(line)
                 if key_match:
                     result.append(f"{key_match.group(1)}... ({len(line)} chars)")
                 else:
@@ -5,6 +5,35 @@ import re
 from .. import config
 from .base import PYTHON_CMD, Processor
 
+# pytest per-line patterns, compiled once at import
+_PYTEST_COLLECT_RE = re.compile(r"^(collecting|collected)\s")
+_PYTEST_SESSION_INFO_RE = re.compile(r"^(platform|rootdir|configfile|plugins|cachedir)[\s:]")
+_PYTEST_FAILURES_RE = re.compile(r"^=+ FAILURES =+")
+_PYTEST_WARNINGS_RE = re.compile(r"^=+ warnings summary =+")
+_PYTEST_FAILURES_END_RE = re.compile(
+    r"^=+ (short test summary|warnings summary|\d+ (failed|passed|error))"
+)
+# "==== title ====" section rules and "____ test_name ____" failure headers
+_SECTION_RULE_RE = re.compile(r"^=+.*=+$")
+_FAILURE_HEADER_RE = re.compile(r"^_+ .+ _+$")
+_PASSED_RE = re.compile(r"\bPASSED\b")
+_FAILED_OR_ERROR_RE = re.compile(r"\bFAILED\b|\bERROR\b")
+_PARAM_PASSED_RE = re.compile(r"^(\S+?)\[(.+)\]\s+PASSED")
+_PARAM_FAILED_RE = re.compile(r"^(\S+?)\[(.+)\]\s+FAILED")
+_SHORT_SUMMARY_RE = re.compile(r"^(FAILED|ERROR)\s")
+_COVERAGE_START_RE = re.compile(r"^-+ coverage|^Name\s+Stmts\s+Miss")
+_COVERAGE_TOTAL_RE = re.compile(r"^TOTAL\s+")
+_COVERAGE_ROW_RE = re.compile(r"^(\S+)\s+\d+\s+\d+\s+(\d+)%")
+_WARNING_TYPE_RE = re.compile(r"(\w+Warning):\s*(.+)")
+_WARNING_LOCATION_RE = re.compile(r"^\s*/|^\s+\w+")
+
+# jest per-line patterns
+_JEST_FAIL_RE = re.compile(r"\bFAIL\b")
+_JEST_PASS_RE = re.compile(r"\bPASS\b")
+_JEST_TOTALS_RE = re.compile(r"^(Tests?|Test Suites?):")
+_JEST_SUITE_TESTS_RE = re.compile(r"\((\d+)\s+tests?\)")
+_JEST_SUMMARY_RE = re.compile(r"^(Tests?|Test Suites?|Snapshots?|Time|Ran all):")
+
 
 class TestOutputProcessor(Processor):
     priority = 21
@@ -90,22 +119,23 @@ class TestOutputProcessor(Processor):
         param_tests: dict[str, dict] = {}  # base_name -> {"passed": int, "failed": [param]}
 
         for line in lines:
+            stripped = line.strip()
             # Skip collection output
-            if re.match(r"^(collecting|collected)\s", line.strip()):
+            if _PYTEST_COLLECT_RE.match(stripped):
                 continue
             # Skip platform/rootdir/configfile lines
-            if re.match(r"^(platform|rootdir|configfile|plugins|cachedir)[\s:]", line.strip()):
+            if _PYTEST_SESSION_INFO_RE.match(stripped):
                 continue
 
             # Detect FAILURES section
-            if re.match(r"^=+ FAILURES =+", line):
+            if _PYTEST_FAILURES_RE.match(line):
                 in_failure = True
                 in_warnings = False
                 result.append(line)
                 continue
 
             # Detect warnings summary section
-            if re.match(r"^=+ warnings summary =+", line):
+            if _PYTEST_WARNINGS_RE.match(line):
                 in_warnings = True
                 in_failure = False
                 if failure_block:
@@ -115,22 +145,20 @@ class TestOutputProcessor(Processor):
 
             if in_warnings:
                 # End of warnings section
-                if re.match(r"^=+.*=+$", line):
+                if _SECTION_RULE_RE.match(line):
                     in_warnings = False
                     # Collapse warnings by type
                     if warning_lines:
                         result.extend(self._collapse_warnings(warning_lines))
                         warning_lines = []
                     summary_lines.append(line)
-                else:
-                    stripped = line.strip()
-                    if stripped and not stripped.startswith("--"):
-                        warning_lines.append(stripped)
+                elif stripped and not stripped.startswith("--"):
+                    warning_lines.append(stripped)
                 continue
 
             if in_failure:
                 # New test failure header within FAILURES section
-                if re.match(r"^_+ .+ _+$", line):
+                if _FAILURE_HEADER_RE.match(line):
                     # Flush previous failure block
                     if failure_block:
                         result.extend(self._truncate_traceback(failure_block))
@@ -139,9 +167,7 @@ class TestOutputProcessor(Processor):
                     continue
 
                 # End of failures block
-                if re.match(
-                    r"^=+ (short test summary|warnings summary|\d+ (failed|passed|error))", line
-                ):
+                if _PYTEST_FAILURES_END_RE.match(line):
                     in_failure = False
                     if failure_block:
                         result.extend(self._truncate_traceback(failure_block))
@@ -150,7 +176,7 @@ class TestOutputProcessor(Processor):
                         in_warnings = True
                     else:
                         result.append(line)
-                elif re.match(r"^=+.*=+$", line) and "FAILURES" not in line:
+                elif _SECTION_RULE_RE.match(line) and "FAILURES" not in line:
                     in_failure = False
                     if failure_block:
                         result.extend(self._truncate_traceback(failure_block))
@@ -161,10 +187,10 @@ class TestOutputProcessor(Processor):
                 continue
 
             # Count passed tests
-            if re.search(r"\bPASSED\b", line):
+            if _PASSED_RE.search(line):
                 passed_count += 1
                 # Track parameterized tests
-                m = re.match(r"^(\S+?)\[(.+)\]\s+PASSED", line.strip())
+                m = _PARAM_PASSED_RE.match(stripped)
                 if m:
                     base = m.group(1)
                     param_tests.setdefault(base, {"passed": 0, "failed": []})
@@ -172,9 +198,9 @@ class TestOutputProcessor(Processor):
                 continue
 
             # Keep FAILED/ERROR individual lines
-            if re.search(r"\bFAILED\b|\bERROR\b", line):
+            if _FAILED_OR_ERROR_RE.search(line):
                 # Track parameterized test failures
-                m = re.match(r"^(\S+?)\[(.+)\]\s+FAILED", line.strip())
+                m = _PARAM_FAILED_RE.match(stripped)
                 if m:
                     base = m.group(1)
                     param = m.group(2)
@@ -185,12 +211,12 @@ class TestOutputProcessor(Processor):
                 continue
 
             # Keep final summary lines (skip "test session starts" header)
-            if re.match(r"^=+.*=+$", line) and "test session starts" not in line:
+            if _SECTION_RULE_RE.match(line) and "test session starts" not in line:
                 summary_lines.append(line)
                 continue
 
             # Keep short test summary section lines
-            if re.match(r"^(FAILED|ERROR)\s", line.strip()):
+            if _SHORT_SUMMARY_RE.match(stripped):
                 result.append(line)
 
         # Handle unclosed warnings section
@@ -229,14 +255,12 @@ class TestOutputProcessor(Processor):
         coverage_end = None
         for i, line in enumerate(lines):
             stripped = line.strip()
-            if coverage_start is None and (
-                re.match(r"^-+ coverage", stripped) or re.match(r"^Name\s+Stmts\s+Miss", stripped)
-            ):
+            if coverage_start is None and _COVERAGE_START_RE.match(stripped):
                 coverage_start = i
             if (
                 coverage_start is not None
                 and i > coverage_start
-                and re.match(r"^TOTAL\s+", stripped)
+                and _COVERAGE_TOTAL_RE.match(stripped)
             ):
                 coverage_end = i
                 break
@@ -259,7 +283,7 @@ class TestOutputProcessor(Processor):
             if stripped.startswith(("Name", "-")):
                 continue
             # Parse: filename  stmts  miss  cover%
-            m = re.match(r"^(\S+)\s+\d+\s+\d+\s+(\d+)%", stripped)
+            m = _COVERAGE_ROW_RE.match(stripped)
             if m:
                 cover_pct = int(m.group(2))
                 if cover_pct < 80:
@@ -281,11 +305,11 @@ class TestOutputProcessor(Processor):
         by_type: dict[str, list[str]] = {}
         for line in warning_lines:
             # Extract warning type: "DeprecationWarning: ...", "UserWarning: ...", etc.
-            m = re.search(r"(\w+Warning):\s*(.+)", line)
+            m = _WARNING_TYPE_RE.search(line)
             if m:
                 wtype = m.group(1)
                 by_type.setdefault(wtype, []).append(line)
-            elif re.match(r"^\s*/", line) or re.match(r"^\s+\w+", line):
+            elif _WARNING_LOCATION_RE.match(line):
                 # Source location lines -- associate with last warning type
                 continue
             else:
@@ -321,7 +345,7 @@ class TestOutputProcessor(Processor):
             stripped = line.strip()
 
             # Capture failure blocks
-            if re.search(r"\bFAIL\b", line) and not re.match(r"^(Tests?|Test Suites?):", stripped):
+            if _JEST_FAIL_RE.search(line) and not _JEST_TOTALS_RE.match(stripped):
                 in_failure = True
                 consecutive_blanks = 0
                 result.append(line)
@@ -341,15 +365,15 @@ class TestOutputProcessor(Processor):
                     consecutive_blanks = 0
                 continue
 
-            if re.search(r"\bPASS\b", line) and not re.match(r"^(Tests?|Test Suites?):", stripped):
+            if _JEST_PASS_RE.search(line) and not _JEST_TOTALS_RE.match(stripped):
                 passed_suites += 1
-                m = re.search(r"\((\d+)\s+tests?\)", line)
+                m = _JEST_SUITE_TESTS_RE.search(line)
                 if m:
                     passed_tests += int(m.group(1))
                 continue
 
             # Keep summary lines
-            if re.match(r"^(Tests?|Test Suites?|Snapshots?|Time|Ran all):", stripped):
+            if _JEST_SUMMARY_RE.match(stripped):
                 result.append(line)
 
         if failure_buffer:
@@ -1,7 +1,7 @@
 """Shared utilities for output processors."""
 
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 # Shared Rust compiler output patterns (used by cargo and cargo_clippy processors)
 RUST_WARNING_START_RE = re.compile(r"^warning(?:\[(\S+)\])?:\s+(.+)")
@@ -11,11 +11,71 @@ RUST_WARNING_SUMMARY_RE = re.compile(r"^warning:\s+.+generated\s+\d+\s+warning")
 RUST_FINISHED_RE = re.compile(r"^\s*Finished\s+")
 RUST_COMPILING_RE = re.compile(r"^\s*Compiling\s+\S+\s+v")
 
+# Braille spinner frames drawn by CLI progress indicators (npm, cargo, ora, ...)
+SPINNER_CHARS = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏⣾⣽⣻⢿⡿⣟⣯⣷"
+
 _DEFAULT_ERROR_RE = re.compile(
     r"\b(error|Error|ERROR|exception|Exception|EXCEPTION|"
     r"fatal|Fatal|FATAL|panic|Panic|PANIC|traceback|Traceback)\b"
 )
 
+# Line boundaries str.splitlines() honours besides "\n"
+_NON_LF_BREAK_RE = re.compile("[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+
+def count_lines(text: str) -> int:
+    """Count lines exactly as ``len(text.splitlines())`` does.
+
+    Uses ``str.count`` so no line list is allocated just to take its length;
+    text containing any other line boundary ``splitlines()`` recognises
+    (``\r`` from CRLF files and progress updates, form feeds, ...) falls
+    back to ``splitlines()`` itself.
+    """
+    if not text:
+        return 0
+    if _NON_LF_BREAK_RE.search(text):
+        return len(text.splitlines())
+    return text.count("\n") + (not text.endswith("\n"))
+
+
+def head_lines(text: str, n: int) -> str:
+    """Return the first *n* lines of *text*, joined with ``\n``.
+
+    Locates the n-th newline with ``str.find`` so only the kept prefix is
+    sliced out, rather than splitting the whole text into a line list.
+    Text containing any other ``splitlines()`` boundary (CRLF, bare ``\r``,
+    form feeds, ...) goes through ``splitlines()`` so the result agrees with
+    :func:`count_lines` and is normalized like the rest of the output.
+    """
+    if n <= 0:
+        return ""
+    if _NON_LF_BREAK_RE.search(text):
+        return "\n".join(text.splitlines()[:n])
+    end = -1
+    for _ in range(n):
+        end = text.find("\n", end + 1)
+        if end == -1:
+            return text[:-1] if text.endswith("\n") else text
+    return text[:end]
+
+
+def tail_lines(text: str, n: int) -> str:
+    """Return the last *n* lines of *text*, joined with ``\n``.
+
+    Mirror of :func:`head_lines`, walking back from the end with ``str.rfind``.
+    """
+    if n <= 0:
+        return ""
+    if _NON_LF_BREAK_RE.search(text):
+        return "\n".join(text.splitlines()[-n:])
+    end = len(text) - text.endswith("\n")
+    start = end
+    for _ in range(n):
+        start = text.rfind("\n", 0, start)
+        if start == -1:
+            return text[:end]
+    return text[start + 1 : end]
+
 
 def compress_json_value(value, depth=0, max_depth=4, important_key_re=None):
     """Recursively compress a JSON value, truncating at depth.
@@ -145,13 +205,8 @@ def group_files_by_dir(lines, max_files):
     dirs = sorted(by_dir.items(), key=lambda x: -len(x[1]))
     for dir_path, files in dirs[:max_files]:
         if len(files) > 10:
-            exts: dict[str, int] = defaultdict(int)
-            for f in files:
-                ext = f.rsplit(".", 1)[-1] if "." in f else "(none)"
-                exts[ext] += 1
-            ext_desc = ", ".join(
-                f"*.{e}:{n}" for e, n in sorted(exts.items(), key=lambda x: -x[1])[:4]
-            )
+            exts = Counter(f.rsplit(".", 1)[-1] if "." in f else "(none)" for f in files)
+            ext_desc = ", ".join(f"*.{e}:{n}" for e, n in exts.most_common(4))
             result.append(f"  {dir_path}/ ({len(files)} files: {ext_desc})")
         elif len(files) > 5:
             result.append(f"  {dir_path}/ ({len(files)} files): {', '.join(files[:3])} ...")
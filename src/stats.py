@@ -135,8 +135,9 @@ def _print_by_command(top_commands):
     print()
 
 
-def main():
-    as_json = "--json" in sys.argv
+def main(argv: list[str] | None = None):
+    args = sys.argv[1:] if argv is None else argv
+    as_json = "--json" in args
 
     # Allow override for testing
     db_dir = os.environ.get("TOKEN_SAVER_DB_DIR")
@@ -146,9 +147,9 @@ def main():
 
     # Allow passing a session ID to show stats for a specific session
     session_id = None
-    for i, arg in enumerate(sys.argv[1:], 1):
-        if arg == "--session" and i < len(sys.argv) - 1:
-            session_id = sys.argv[i + 1]
+    for i, arg in enumerate(args):
+        if arg == "--session" and i < len(args) - 1:
+            session_id = args[i + 1]
 
     tracker = SavingsTracker(session_id=session_id)
     session = tracker.get_session_stats()
@@ -0,0 +1,63 @@
+"""Throughput benchmarks for processors on the largest synthetic inputs.
+
+Not collected by a plain ``pytest`` run (the file does not match
+``test_*.py``). Run explicitly with pytest-benchmark installed::
+
+    python3 -m pytest tests/bench_processors.py -m benchmark
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.processors.file_content import FileContentProcessor
+from src.processors.generic import GenericProcessor
+from src.processors.git import GitProcessor
+from src.processors.lint_output import LintOutputProcessor
+from src.processors.search import SearchProcessor
+from src.processors.test_output import TestOutputProcessor
+
+pytestmark = pytest.mark.benchmark
+
+_DIFF_300 = "\n".join(
+    ["diff --git a/big.py b/big.py", "@@ -1,300 +1,300 @@", *(f"+line {i}" for i in range(300))]
+)
+_BRANCH_50 = "\n".join(["* main", *(f"  feature/branch-{i}" for i in range(50))])
+_REFLOG_50 = "\n".join(f"abc{i:04d} HEAD@{{{i}}}: commit: msg {i}" for i in range(50))
+_LOG_500 = "\n".join(f"data line {i}" for i in range(500))
+_GENERIC_600 = "\n".join(
+    f"\x1b[32mline {i}\x1b[0m downloading {i % 100}% of package-{i}" for i in range(600)
+)
+# ~100 KB of escape-free log text: exercises the no-ESC fast path of ANSI stripping
+_PLAIN_2000 = "\n".join(
+    f"2024-01-01 12:00:{i % 60:02d} worker-{i % 8} handled job {i}" for i in range(2000)
+)
+_GREP_500 = "\n".join(f"src/module_{i % 20}.py:{i}:    match = compute({i})" for i in range(500))
+# One 165 KB line of near-miss violations: quadratic if the lint regexes backtrack
+_LINT_NEAR_MISS = "x.py:1:1: (" * 15000
+_PYTEST_500 = "\n".join(
+    [
+        "============================= test session starts ==============================",
+        *(f"tests/test_mod.py::test_case_{i} PASSED" for i in range(500)),
+        "============================= 500 passed in 1.23s ==============================",
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    ("processor", "command", "output"),
+    [
+        pytest.param(GitProcessor(), "git diff", _DIFF_300, id="git-diff-300"),
+        pytest.param(GitProcessor(), "git branch -a", _BRANCH_50, id="git-branch-50"),
+        pytest.param(GitProcessor(), "git reflog", _REFLOG_50, id="git-reflog-50"),
+        pytest.param(FileContentProcessor(), "cat app.log", _LOG_500, id="file-content-500"),
+        pytest.param(GenericProcessor(), "some-tool", _GENERIC_600, id="generic-600"),
+        pytest.param(GenericProcessor(), "some-tool", _PLAIN_2000, id="generic-plain-2000"),
+        pytest.param(SearchProcessor(), "grep -rn match src", _GREP_500, id="search-500"),
+        pytest.param(TestOutputProcessor(), "pytest", _PYTEST_500, id="pytest-500"),
+        pytest.param(LintOutputProcessor(), "ruff check", _LINT_NEAR_MISS, id="lint-near-miss"),
+    ],
+)
+def test_process_throughput(benchmark, processor, command, output):
+    result = benchmark(processor.process, command, output)
+    assert len(result) <= len(output)
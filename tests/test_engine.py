@@ -205,6 +205,18 @@ class TestCompressionEngine:
             assert processor in ("generic", "none")
             assert "x200" in compressed or "repeated" in compressed
 
+    def test_dispatch_memoized_per_command(self):
+        git = self.engine._by_name["git"]
+        calls = []
+        original = git.can_handle
+        git.can_handle = lambda cmd: calls.append(cmd) or original(cmd)
+        try:
+            assert self.engine._find_processor("git status") is git
+            assert self.engine._find_processor("git status") is git
+        finally:
+            git.can_handle = original
+        assert calls == ["git status"]
+
 
 class TestProcessorRegistry:
     """Tests for auto-discovery and the processor registry."""
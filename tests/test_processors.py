@@ -1,9 +1,9 @@
 """Tests for individual processors."""
 
-import os
-import sys
+import json
+from itertools import chain, repeat
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
 from src.chain_utils import extract_primary_command
 from src.processors.ansible import AnsibleProcessor
@@ -37,6 +37,51 @@ from src.processors.terraform import TerraformProcessor
 from src.processors.test_output import TestOutputProcessor
 
 
+def _assert_all_in(needles, haystack):
+    """Assert every needle occurs in haystack, reporting all missing ones at once."""
+    missing = [n for n in needles if n not in haystack]
+    assert not missing, f"missing {missing!r} in:\n{haystack}"
+
+
+# 10 context lines on either side of a single change; the default
+# max_diff_context_lines keeps 3 before and 3 after.
+_DIFF_CONTEXT_OUTPUT = "\n".join(
+    [
+        "diff --git a/file.py b/file.py",
+        "@@ -1,20 +1,21 @@",
+        *(f" context_before_{i}" for i in range(10)),
+        "+added line",
+        *(f" context_after_{i}" for i in range(10)),
+    ]
+)
+
+
+# Classic (non-BuildKit) docker build: steps, intermediate noise and result
+_DOCKER_BUILD_OUTPUT = "\n".join(
+    [
+        "Sending build context to Docker daemon  2.5MB",
+        "Step 1/10 : FROM node:18",
+        " ---> abc123def456",
+        "Step 2/10 : WORKDIR /app",
+        "Running in 789abc012def",
+        "Removing intermediate container 789abc012def",
+        " ---> 345def678abc",
+        "Step 3/10 : COPY package.json .",
+        "Step 4/10 : RUN npm install",
+        "Downloading lodash@4.17.21",
+        "Installing lodash@4.17.21",
+        "Step 5/10 : COPY . .",
+        "Step 6/10 : RUN npm run build",
+        "Step 7/10 : FROM nginx:alpine",
+        "Step 8/10 : COPY --from=0 /app/dist /usr/share/nginx/html",
+        "Step 9/10 : EXPOSE 80",
+        'Step 10/10 : CMD ["nginx", "-g", "daemon off;"]',
+        "Successfully built abc123def",
+        "Successfully tagged myapp:latest",
+    ]
+)
+
+
 class TestGitProcessor:
     def setup_method(self):
         self.p = GitProcessor()
@@ -132,6 +177,29 @@ class TestGitProcessor:
         result = self.p.process("git log --oneline", output)
         assert "more" in result
 
+    def test_log_oneline_truncation_keeps_exact_head(self):
+        lines = [f"abc{i:04d} commit message {i}" for i in range(30)]
+        output = "\n".join(lines) + "\n"
+        result = self.p.process("git log --oneline", output)
+        assert result.splitlines()[:-1] == lines[:10]
+        assert result.endswith("... (20 more)")
+
+    def test_log_oneline_truncation_normalizes_crlf(self):
+        lines = [f"abc{i:04d} commit message {i}" for i in range(30)]
+        output = "\r\n".join(lines) + "\r\n"
+        result = self.p.process("git log --oneline", output)
+        assert "\r" not in result
+        assert result.split("\n")[:-1] == lines[:10]
+
+    def test_log_oneline_truncation_form_feed_is_a_line_break(self):
+        """Head and "(N more)" agree with splitlines() when a subject holds a form feed."""
+        output = "\n".join(f"abc{i:04d} commit message {i}" for i in range(30))
+        output = output.replace("message 3", "message\x0c3")
+        lines = output.splitlines()
+        result = self.p.process("git log --oneline", output)
+        assert result.split("\n")[:-1] == lines[:10]
+        assert result.endswith(f"... ({len(lines) - 10} more)")
+
     def test_push_removes_progress(self):
         output = "\n".join(
             [
@@ -198,28 +266,24 @@ class TestGitProcessor:
         assert "diff --git a/file.py" in result
         assert "+added line" in result
 
-    def test_diff_context_lines_limited(self):
+    @pytest.mark.parametrize(
+        ("needle", "present"),
+        [
+            ("+added line", True),
+            # Early context lines should be dropped
+            ("context_before_0", False),
+            # Last 3 before the change should be kept
+            ("context_before_9", True),
+            # First 3 after should be kept
+            ("context_after_0", True),
+            # Late context lines should be dropped
+            ("context_after_9", False),
+        ],
+    )
+    def test_diff_context_lines_limited(self, needle, present):
         """Context lines should be limited to max_diff_context_lines around changes."""
-        lines = ["diff --git a/file.py b/file.py", "@@ -1,20 +1,21 @@"]
-        # 10 context lines before the change
-        for i in range(10):
-            lines.append(f" context_before_{i}")
-        lines.append("+added line")
-        # 10 context lines after the change
-        for i in range(10):
-            lines.append(f" context_after_{i}")
-        output = "\n".join(lines)
-        result = self.p.process("git diff", output)
-        # Should have at most 3 context lines before and 3 after (default)
-        assert "+added line" in result
-        # Early context lines should be dropped
-        assert "context_before_0" not in result
-        # Last 3 before the change should be kept
-        assert "context_before_9" in result
-        # First 3 after should be kept
-        assert "context_after_0" in result
-        # Late context lines should be dropped
-        assert "context_after_9" not in result
+        result = self.p.process("git diff", _DIFF_CONTEXT_OUTPUT)
+        assert (needle in result) is present
 
     def test_diff_stat_format(self):
         """git diff --stat visual bars should be stripped."""
@@ -587,9 +651,7 @@ class TestPytestParameterized:
 
     def test_all_param_passed_grouped(self):
         """50 parameterized tests all PASSED should show just the count."""
-        lines = []
-        for i in range(50):
-            lines.append(f"tests/test_math.py::test_add[{i}] PASSED")
+        lines = [f"tests/test_math.py::test_add[{i}] PASSED" for i in range(50)]
         lines.append("======================== 50 passed in 1.0s ========================")
         output = "\n".join(lines)
         result = self.p.process("pytest -v", output)
@@ -599,9 +661,7 @@ class TestPytestParameterized:
 
     def test_param_with_failures_grouped(self):
         """Parameterized tests with failures should show grouped summary."""
-        lines = []
-        for i in range(47):
-            lines.append(f"tests/test_math.py::test_add[{i}] PASSED")
+        lines = [f"tests/test_math.py::test_add[{i}] PASSED" for i in range(47)]
         for i in range(47, 50):
             lines.append(f"tests/test_math.py::test_add[{i}] FAILED")
         lines.append("======================== 47 passed, 3 failed ========================")
@@ -753,42 +813,25 @@ class TestBuildOutputProcessor:
         assert self.p.can_handle("npm audit")
         assert self.p.can_handle("yarn audit")
 
-    def test_docker_build_keeps_steps_and_result(self):
-        output = "\n".join(
-            [
-                "Sending build context to Docker daemon  2.5MB",
-                "Step 1/10 : FROM node:18",
-                " ---> abc123def456",
-                "Step 2/10 : WORKDIR /app",
-                "Running in 789abc012def",
-                "Removing intermediate container 789abc012def",
-                " ---> 345def678abc",
-                "Step 3/10 : COPY package.json .",
-                "Step 4/10 : RUN npm install",
-                "Downloading lodash@4.17.21",
-                "Installing lodash@4.17.21",
-                "Step 5/10 : COPY . .",
-                "Step 6/10 : RUN npm run build",
-                "Step 7/10 : FROM nginx:alpine",
-                "Step 8/10 : COPY --from=0 /app/dist /usr/share/nginx/html",
-                "Step 9/10 : EXPOSE 80",
-                'Step 10/10 : CMD ["nginx", "-g", "daemon off;"]',
-                "Successfully built abc123def",
-                "Successfully tagged myapp:latest",
-            ]
-        )
-        result = self.p.process("docker build -t myapp .", output)
-        # Steps preserved
-        assert "Step 1/10" in result
-        assert "Step 10/10" in result
-        # Final result preserved
-        assert "Successfully built" in result
-        assert "Successfully tagged" in result
-        # Noise removed
-        assert "Sending build context" not in result
-        assert "Running in" not in result
-        assert "Removing intermediate" not in result
-        assert " ---> " not in result
+    @pytest.mark.parametrize(
+        ("needle", "present"),
+        [
+            # Steps preserved
+            ("Step 1/10", True),
+            ("Step 10/10", True),
+            # Final result preserved
+            ("Successfully built", True),
+            ("Successfully tagged", True),
+            # Noise removed
+            ("Sending build context", False),
+            ("Running in", False),
+            ("Removing intermediate", False),
+            (" ---> ", False),
+        ],
+    )
+    def test_docker_build_keeps_steps_and_result(self, needle, present):
+        result = self.p.process("docker build -t myapp .", _DOCKER_BUILD_OUTPUT)
+        assert (needle in result) is present
 
     def test_docker_build_keeps_errors(self):
         output = "\n".join(
@@ -885,9 +928,7 @@ class TestLintOutputProcessor:
         assert self.p.process("ruff check .", "") == ""
 
     def test_groups_by_rule(self):
-        lines = []
-        for i in range(15):
-            lines.append(f"src/file{i}.py:10:1: E501 line too long")
+        lines = [f"src/file{i}.py:10:1: E501 line too long" for i in range(15)]
         for i in range(5):
             lines.append(f"src/file{i}.py:1:1: F401 imported but unused")
         output = "\n".join(lines)
@@ -898,9 +939,9 @@ class TestLintOutputProcessor:
         assert len(result) < len(output)
 
     def test_mypy_errors_grouped(self):
-        lines = []
-        for i in range(10):
-            lines.append(f"src/file{i}.py:{i + 1}: error: Incompatible types [assignment]")
+        lines = [
+            f"src/file{i}.py:{i + 1}: error: Incompatible types [assignment]" for i in range(10)
+        ]
         for i in range(5):
             lines.append(f"src/file{i}.py:{i + 1}: error: Missing return [return]")
         output = "\n".join(lines)
@@ -908,6 +949,14 @@ class TestLintOutputProcessor:
         assert "assignment" in result
         assert "15 issues" in result
 
+    def test_mypy_column_numbers_grouped(self):
+        """mypy --show-column-numbers adds a column after the line number."""
+        output = "\n".join(
+            f"src/file{i}.py:{i + 1}:5: error: Incompatible types  [assignment]" for i in range(12)
+        )
+        result = self.p.process("mypy --show-column-numbers src/", output)
+        assert "assignment: 12 occurrences in 12 files" in result
+
     def test_few_violations_not_grouped(self):
         """3 or fewer of a rule should be shown individually."""
         output = "\n".join(
@@ -942,22 +991,26 @@ class TestLintOutputProcessor:
         assert self.p.can_handle("biome lint src/")
 
     def test_shellcheck_violations_parsed(self):
-        lines = []
-        for i in range(10):
-            lines.append(f"script.sh:{i + 1}:1: warning - SC2086 Double quote to prevent globbing")
+        lines = [
+            f"script.sh:{i + 1}:1: warning - SC2086 Double quote to prevent globbing"
+            for i in range(10)
+        ]
         output = "\n".join(lines)
         result = self.p.process("shellcheck script.sh", output)
         assert "SC2086" in result
         assert "10 issues" in result or "10 occurrences" in result
 
     def test_hadolint_violations_parsed(self):
-        lines = []
-        for i in range(8):
-            lines.append(f"Dockerfile:{i + 1} DL3008 Pin versions in apt get install")
+        lines = [f"Dockerfile:{i + 1} DL3008 Pin versions in apt get install" for i in range(8)]
         output = "\n".join(lines)
         result = self.p.process("hadolint Dockerfile", output)
         assert "DL3008" in result
 
+    def test_hadolint_column_numbers_grouped(self):
+        output = "\n".join(f"Dockerfile:{i + 1}:1 DL3008 Pin versions" for i in range(8))
+        result = self.p.process("hadolint Dockerfile", output)
+        assert "DL3008: 8 occurrences" in result
+
     def test_biome_violations_parsed(self):
         lines = []
         for i in range(10):
@@ -985,6 +1038,20 @@ class TestLintOutputProcessor:
             line.strip() for line in result.splitlines() if line.strip().startswith("1 warning:")
         ]
 
+    def test_pathological_line_not_a_violation(self):
+        """A long line of near-miss violations is left alone.
+
+        Its matching cost is tracked by the lint-near-miss case in
+        tests/bench_processors.py.
+        """
+        output = "x.py:1:1: (" * 15000
+        assert self.p.process("ruff check", output) == output
+
+    def test_windows_drive_letter_path(self):
+        output = "\n".join(f"C:\\src\\file{i}.py:{i + 1}:1: E501 line too long" for i in range(8))
+        result = self.p.process("ruff check", output)
+        assert "E501: 8 occurrences in 8 files" in result
+
 
 class TestFileListingProcessor:
     def setup_method(self):
@@ -1082,6 +1149,17 @@ class TestFileListingProcessor:
         assert "5K" in result
         assert "1.0M" in result
 
+    def test_ls_long_iso_time_style_keeps_spaced_names(self):
+        output = (
+            "total 8\n"
+            "-rw-r--r--  1 user staff  10 2025-01-12 17:24 my notes.txt\n"
+            "-rw-r--r--  1 user staff  10 2025-01-12 17:24:00.000000000 +0100 other file.txt\n"
+        )
+        result = self.p.process("ls -l --time-style=long-iso", output)
+        assert "  my notes.txt" in result
+        assert "  other file.txt" in result
+        assert "2025" not in result
+
     def test_can_handle_exa_eza(self):
         assert self.p.can_handle("exa -la")
         assert self.p.can_handle("eza --long")
@@ -1141,6 +1219,33 @@ class TestFileContentProcessor:
         assert "line 0:" in result
         assert "line 499:" in result
 
+    def test_truncation_keeps_exact_head_and_tail(self):
+        from src import config
+
+        keep_head = config.get("file_keep_head")
+        keep_tail = config.get("file_keep_tail")
+        lines = [f"line {i}" for i in range(500)]
+        result = self.p.process("cat notes.md", "\n".join(lines) + "\n")
+        result_lines = result.splitlines()
+        assert result_lines[:keep_head] == lines[:keep_head]
+        assert result_lines[-keep_tail:] == lines[-keep_tail:]
+        assert f"({500 - keep_head - keep_tail} lines truncated, 500 total lines)" in result
+
+    def test_truncation_normalizes_crlf(self):
+        from src import config
+
+        keep_head = config.get("file_keep_head")
+        lines = [f"line {i}" for i in range(500)]
+        result = self.p.process("cat notes.md", "\r\n".join(lines) + "\r\n")
+        assert "\r" not in result
+        assert result.split("\n")[:keep_head] == lines[:keep_head]
+
+    def test_crlf_log_detected_without_extension(self):
+        lines = [f"2024-01-01 10:00:{i % 60:02d} INFO request {i} handled" for i in range(600)]
+        result = self.p.process("cat service", "\r\n".join(lines) + "\r\n")
+        assert self.p._detect_heuristic("\r\n".join(lines)) == "log"
+        assert "\r" not in result
+
     def test_exact_threshold_not_truncated(self):
         from src import config
 
@@ -1149,10 +1254,16 @@ class TestFileContentProcessor:
         result = self.p.process("cat file.xyz", output)
         assert result == output
 
+    def test_exact_threshold_with_trailing_newline_not_truncated(self):
+        from src import config
+
+        threshold = config.get("max_file_lines")
+        output = "".join(f"line {i}\n" for i in range(threshold))
+        result = self.p.process("cat file.xyz", output)
+        assert result == output
+
     def test_json_compression_preserves_keys(self):
         """JSON files should be compressed but preserve all top-level keys."""
-        import json
-
         data = {
             "name": "my-project",
             "version": "1.0.0",
@@ -1177,8 +1288,6 @@ class TestFileContentProcessor:
 
     def test_npm_lock_file_compression(self):
         """package-lock.json should extract dependency names + versions."""
-        import json
-
         data = {
             "name": "my-project",
             "lockfileVersion": 3,
@@ -1295,6 +1404,11 @@ class TestGenericProcessor:
         assert "Normal text" in result
         assert "\x1b" not in result
 
+    def test_strips_st_terminated_osc_and_private_csi(self):
+        """OSC hyperlinks end with ESC \\; cursor toggles use private-mode CSI."""
+        output = "\x1b[?25l\x1b]8;;https://example.com\x1b\\link\x1b]8;;\x1b\\ done\x1b[?25h"
+        assert self.p.clean(output) == "link done"
+
     def test_collapses_repeated_lines(self):
         output = "Building...\n" * 20
         result = self.p.process("cmd", output)
@@ -1333,6 +1447,10 @@ class TestGenericProcessor:
         for line in result.splitlines():
             assert line == line.rstrip()
 
+    def test_strips_trailing_whitespace_crlf(self):
+        output = "line1  \r\nline2\t\r\n\x1b[1mline3 \x1b[0m "
+        assert self.p.clean(output) == "line1\nline2\nline3"
+
     def test_clean_method(self):
         """clean() should only strip ANSI and blank lines, not dedup or truncate."""
         output = "\x1b[32mline\x1b[0m\n\n\n\x1b[31mline\x1b[0m"
@@ -1342,6 +1460,10 @@ class TestGenericProcessor:
         # clean() should NOT collapse repeated "line" into "line (x2)"
         assert result.count("line") == 2
 
+    def test_clean_collapses_blank_runs_everywhere(self):
+        output = "\n \n\t\nhead\r\n\r\n  \r\nmid\n\n\n\ntail\n\n\n"
+        assert self.p.clean(output) == "\nhead\n\nmid\n\ntail\n"
+
     def test_similar_lines_progress_collapsed(self):
         """Curl-like progress lines differing only in % should be collapsed."""
         lines = [
@@ -1439,6 +1561,25 @@ class TestMinifiedFileDetection:
         # Source code (.js) should pass-through unchanged
         assert result == output
 
+    def test_carriage_return_progress_log_not_minified(self):
+        """\\r progress updates count as lines, so a build log isn't minified."""
+        progress = "\r".join(f"  {pct}% downloading layer" for pct in range(60))
+        output = "\n".join(f"step {i}: {progress}" for i in range(100))
+        result = self.p.process("cat build.log", output)
+        assert "minified file" not in result
+        assert "step 0:" in result
+
+    def test_carriage_return_separated_file_not_minified(self):
+        output = "\r".join(f"note line {i} with some text" for i in range(600))
+        result = self.p.process("cat notes.txt", output)
+        assert "minified file" not in result
+
+    def test_form_feed_separated_file_not_minified(self):
+        """Form feeds (page breaks in C/GNU sources) are line breaks too."""
+        output = "\x0c".join(f"page {i} of the manual with some text" for i in range(600))
+        result = self.p.process("cat manual.txt", output)
+        assert "minified file" not in result
+
 
 class TestNetworkProcessor:
     def setup_method(self):
@@ -1501,6 +1642,25 @@ class TestNetworkProcessor:
         # Response body kept
         assert '"data": "value"' in result
 
+    def test_curl_verbose_strips_progress_header(self):
+        output = "\n".join(
+            [
+                "  % Total    % Received % Xferd  Average Speed   Time    Time     Time  Current",
+                "                                 Dload  Upload   Total   Spent    Left  Speed",
+                "* Trying 93.184.216.34:443...",
+                "> GET /api/data HTTP/2",
+                "< HTTP/2 200",
+                "<",
+                '{"data": "value"}',
+                "100    17  100    17    0     0    170      0 --:--:-- --:--:-- --:--:--   170",
+            ]
+        )
+        result = self.p.process("curl -v https://example.com/api/data", output)
+        assert "% Total" not in result
+        assert "Dload" not in result
+        assert "--:--:--" not in result
+        assert '"data": "value"' in result
+
     def test_curl_progress_stripped(self):
         output = "\n".join(
             [
@@ -1570,8 +1730,6 @@ class TestNetworkProcessor:
 
     def test_curl_json_compressed(self):
         """Large JSON responses should be summarized."""
-        import json
-
         data = {
             "users": [
                 {"id": i, "name": f"User {i}", "email": f"user{i}@example.com"} for i in range(20)
@@ -1688,8 +1846,6 @@ class TestDockerProcessor:
         assert self.p.can_handle("docker compose build")
 
     def test_inspect_summarizes_json(self):
-        import json
-
         data = [
             {
                 "Id": "abc123def456789",
@@ -1722,6 +1878,12 @@ class TestDockerProcessor:
         assert "total lines" in result
         assert len(result) < len(output)
 
+    def test_inspect_json_with_line_separator_in_string(self):
+        """U+2028 inside a JSON string is a line break for splitlines(), not for JSON."""
+        output = '[{"Id": "abc123", "Name": "/web", "Config": {"Image": "a\u2028b"}}]'
+        result = self.p.process("docker inspect web", output)
+        assert "Name: /web" in result
+
     def test_inspect_invalid_json_truncates(self):
         lines = [f"line {i}: not json" for i in range(60)]
         output = "\n".join(lines)
@@ -1812,6 +1974,27 @@ class TestDockerProcessor:
         assert "dead-app" in result
 
 
+_PIP_LIST_50 = "\n".join(
+    ["Package    Version", "---------- -------", *(f"package-{i:03d}  {i}.0.0" for i in range(50))]
+)
+
+
+# 10 top-level packages with 5 sub-dependencies each
+_NPM_LS_TREE = "\n".join(
+    [
+        "my-project@1.0.0 /home/user/project",
+        *(
+            line
+            for i in range(10)
+            for line in (
+                f"├── package-{i}@{i}.0.0",
+                *(f"│   ├── sub-dep-{i}-{j}@0.{j}.0" for j in range(5)),
+            )
+        ),
+    ]
+)
+
+
 class TestPackageListProcessor:
     def setup_method(self):
         self.p = PackageListProcessor()
@@ -1827,27 +2010,11 @@ class TestPackageListProcessor:
         assert not self.p.can_handle("npm install")
 
     def test_pip_list_truncated(self):
-        lines = ["Package    Version", "---------- -------"]
-        for i in range(50):
-            lines.append(f"package-{i:03d}  {i}.0.0")
-        output = "\n".join(lines)
-        result = self.p.process("pip list", output)
+        result = self.p.process("pip list", _PIP_LIST_50)
         assert "50 packages installed" in result
         assert "package-000" in result
         assert "... (35 more)" in result
 
-    def test_pip_list_short_unchanged(self):
-        output = "\n".join(
-            [
-                "Package  Version",
-                "-------- -------",
-                "pip      23.0",
-                "setuptools 67.0",
-            ]
-        )
-        result = self.p.process("pip list", output)
-        assert result == output
-
     def test_pip_freeze_truncated(self):
         lines = [f"package-{i}=={i}.0.0" for i in range(30)]
         output = "\n".join(lines)
@@ -1856,16 +2023,10 @@ class TestPackageListProcessor:
         assert "... (15 more)" in result
 
     def test_npm_ls_collapses_tree(self):
-        lines = ["my-project@1.0.0 /home/user/project"]
-        for i in range(10):
-            lines.append(f"├── package-{i}@{i}.0.0")
-            for j in range(5):
-                lines.append(f"│   ├── sub-dep-{i}-{j}@0.{j}.0")
-        output = "\n".join(lines)
-        result = self.p.process("npm ls", output)
+        result = self.p.process("npm ls", _NPM_LS_TREE)
         assert "total dependencies" in result
         assert "Top-level" in result
-        assert len(result.splitlines()) < len(lines)
+        assert len(result.splitlines()) < 61
 
     def test_npm_ls_shows_issues(self):
         lines = [
@@ -1889,6 +2050,11 @@ class TestPackageListProcessor:
         assert not bp.can_handle("npm list")
 
 
+_GREP_10_FILES = "\n".join(
+    f"src/file{i}.py:{j + 1}:match content {j}" for i in range(10) for j in range(5)
+)
+
+
 class TestSearchProcessor:
     def setup_method(self):
         self.p = SearchProcessor()
@@ -1899,37 +2065,25 @@ class TestSearchProcessor:
         assert self.p.can_handle("ag pattern src/")
         assert not self.p.can_handle("git status")
 
-    def test_short_output_unchanged(self):
-        output = "\n".join([f"src/file{i}.py:10:match here" for i in range(5)])
-        result = self.p.process("grep -r pattern .", output)
-        assert result == output
-
     def test_groups_by_file(self):
-        lines = []
-        for i in range(10):
-            for j in range(5):
-                lines.append(f"src/file{i}.py:{j + 1}:match content {j}")
-        output = "\n".join(lines)
-        result = self.p.process("grep -r pattern .", output)
+        result = self.p.process("grep -r pattern .", _GREP_10_FILES)
         assert "50 matches across 10 files" in result
         assert "... (" in result  # truncated per-file
 
     def test_strips_binary_warnings(self):
-        output = "\n".join(
+        block = "\n".join(
             [
                 "src/app.py:10:pattern match",
                 "Binary file node_modules/.cache/foo matches",
                 "src/util.py:20:another pattern match",
             ]
-            * 15
         )
+        output = "\n".join([block] * 15)
         result = self.p.process("grep -r pattern .", output)
         assert "Binary file" not in result
 
     def test_many_files_truncated(self):
-        lines = []
-        for i in range(30):
-            lines.append(f"src/dir/file{i}.py:1:match")
+        lines = [f"src/dir/file{i}.py:1:match" for i in range(30)]
         output = "\n".join(lines)
         result = self.p.process("rg pattern", output)
         assert "30 matches" in result
@@ -1947,11 +2101,6 @@ class TestSearchProcessor:
         assert "src/components" in result
         assert "src/utils" in result
 
-    def test_fd_short_unchanged(self):
-        output = "src/main.py\nsrc/util.py\nsrc/app.py"
-        result = self.p.process("fd -e py", output)
-        assert result == output
-
 
 class TestSearchDirectoryGrouping:
     """Tests for search result directory grouping with large result sets."""
@@ -2004,9 +2153,7 @@ class TestDockerComposeLogs:
 
     def test_compose_logs_errors_shown(self):
         """Service with errors should show error lines."""
-        lines = []
-        for i in range(100):
-            lines.append(f"web  | Normal log line {i}")
+        lines = [f"web  | Normal log line {i}" for i in range(100)]
         lines.append("web  | ERROR: Connection refused")
         lines.append("web  | Failed to connect to database")
         for i in range(100):
@@ -2018,43 +2165,57 @@ class TestDockerComposeLogs:
 
     def test_compose_no_errors_shows_tail(self):
         """Service with no errors should show last 3 lines."""
-        lines = []
-        for i in range(100):
-            lines.append(f"web  | Log line {i}")
+        lines = [f"web  | Log line {i}" for i in range(100)]
         output = "\n".join(lines)
         result = self.p.process("docker compose logs", output)
         assert "Log line 99" in result
         assert "0 errors" in result
 
 
+# 20 healthy pods and one crash-looping one
+_GET_PODS_21 = "\n".join(
+    [
+        "NAME                    READY   STATUS    RESTARTS   AGE",
+        *(f"web-{i:03d}                 1/1     Running   0          {i}h" for i in range(20)),
+        "web-failing             0/1     CrashLoopBackOff   5          2h",
+    ]
+)
+
+
 class TestKubectlProcessor:
     def setup_method(self):
         self.p = KubectlProcessor()
 
-    def test_can_handle(self):
-        assert self.p.can_handle("kubectl get pods")
-        assert self.p.can_handle("kubectl describe pod my-pod")
-        assert self.p.can_handle("kubectl logs my-pod")
-        assert self.p.can_handle("oc get pods")
-        assert not self.p.can_handle("docker ps")
-
-    def test_can_handle_with_global_options(self):
-        assert self.p.can_handle("kubectl -n kube-system get pods")
-        assert self.p.can_handle("kubectl --namespace=default get svc")
-        assert self.p.can_handle("kubectl --context prod describe pod my-pod")
-        assert self.p.can_handle("kubectl -A get pods")
-        assert self.p.can_handle("kubectl --all-namespaces get pods")
-        assert self.p.can_handle("kubectl -n monitoring --context staging logs my-pod")
-        assert self.p.can_handle("kubectl --kubeconfig /path/config get nodes")
+    @pytest.mark.parametrize(
+        ("command", "expected"),
+        [
+            ("kubectl get pods", True),
+            ("kubectl describe pod my-pod", True),
+            ("kubectl logs my-pod", True),
+            ("oc get pods", True),
+            ("docker ps", False),
+        ],
+    )
+    def test_can_handle(self, command, expected):
+        assert self.p.can_handle(command) is expected
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "kubectl -n kube-system get pods",
+            "kubectl --namespace=default get svc",
+            "kubectl --context prod describe pod my-pod",
+            "kubectl -A get pods",
+            "kubectl --all-namespaces get pods",
+            "kubectl -n monitoring --context staging logs my-pod",
+            "kubectl --kubeconfig /path/config get nodes",
+        ],
+    )
+    def test_can_handle_with_global_options(self, command):
+        assert self.p.can_handle(command)
 
     def test_get_pods_summarizes_healthy(self):
-        header = "NAME                    READY   STATUS    RESTARTS   AGE"
-        entries = []
-        for i in range(20):
-            entries.append(f"web-{i:03d}                 1/1     Running   0          {i}h")
-        entries.append("web-failing             0/1     CrashLoopBackOff   5          2h")
-        output = "\n".join([header, *entries])
-        result = self.p.process("kubectl get pods", output)
+        result = self.p.process("kubectl get pods", _GET_PODS_21)
         assert "CrashLoopBackOff" in result
         assert "20 pods Running/Ready" in result
         # AGE column should be stripped
@@ -2119,10 +2280,16 @@ class TestKubectlProcessor:
         assert "NullPointerException" in result
         assert len(result.splitlines()) < 100
 
-    def test_can_handle_apply_delete_create(self):
-        assert self.p.can_handle("kubectl apply -f deployment.yaml")
-        assert self.p.can_handle("kubectl delete pod my-pod")
-        assert self.p.can_handle("kubectl create namespace test")
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "kubectl apply -f deployment.yaml",
+            "kubectl delete pod my-pod",
+            "kubectl create namespace test",
+        ],
+    )
+    def test_can_handle_apply_delete_create(self, command):
+        assert self.p.can_handle(command)
 
     def test_mutate_keeps_results(self):
         lines = [
@@ -2151,11 +2318,6 @@ class TestKubectlProcessor:
         assert "Warning" in result
         assert "web created" in result
 
-    def test_mutate_short_unchanged(self):
-        output = "pod/test-pod deleted"
-        result = self.p.process("kubectl delete pod test-pod", output)
-        assert result == output
-
     def test_multi_container_ready_detection(self):
         """_is_all_ready should correctly handle multi-container pods."""
         assert self.p._is_all_ready("my-pod  2/2  Running  0  1h")
@@ -2238,11 +2400,6 @@ class TestEnvProcessor:
         result = self.p.process("env", output)
         assert "total entries" in result  # PATH was truncated
 
-    def test_short_output_unchanged(self):
-        output = "\n".join([f"VAR{i}=val{i}" for i in range(5)])
-        result = self.p.process("env", output)
-        assert result == output
-
 
 class TestSystemInfoProcessor:
     def setup_method(self):
@@ -2261,11 +2418,6 @@ class TestSystemInfoProcessor:
         assert "... (" in result
         assert "more entries" in result
 
-    def test_du_short_unchanged(self):
-        output = "4K\tdir1\n8K\tdir2\n12K\ttotal"
-        result = self.p.process("du -sh *", output)
-        assert result == output
-
     def test_wc_sorts_and_truncates(self):
         lines = [f"  {i * 10} src/file{i}.py" for i in range(25)]
         lines.append("  3000 total")
@@ -2308,24 +2460,35 @@ class TestSystemInfoProcessor:
         assert "system mounts hidden" in result
 
 
+_STATE_LIST_35 = "\n".join(
+    [*(f"aws_instance.web_{i}" for i in range(20)), *(f"aws_s3_bucket.data_{i}" for i in range(15))]
+)
+
+
+def _pad_blank_lines(lines, count):
+    """Join *lines* followed by *count* blank lines."""
+    return "\n".join(chain(lines, repeat("", count)))
+
+
 class TestTerraformProcessor:
     def setup_method(self):
         self.p = TerraformProcessor()
 
-    def test_can_handle(self):
-        assert self.p.can_handle("terraform plan")
-        assert self.p.can_handle("terraform apply")
-        assert self.p.can_handle("terraform destroy")
-        assert self.p.can_handle("tofu plan")
-        assert not self.p.can_handle("git status")
-
-    def test_short_output_unchanged(self):
-        output = "No changes. Infrastructure is up-to-date."
-        result = self.p.process("terraform plan", output)
-        assert result == output
+    @pytest.mark.parametrize(
+        ("command", "expected"),
+        [
+            ("terraform plan", True),
+            ("terraform apply", True),
+            ("terraform destroy", True),
+            ("tofu plan", True),
+            ("git status", False),
+        ],
+    )
+    def test_can_handle(self, command, expected):
+        assert self.p.can_handle(command) is expected
 
     def test_strips_provider_init(self):
-        output = "\n".join(
+        output = _pad_blank_lines(
             [
                 "Initializing the backend...",
                 "Initializing provider plugins...",
@@ -2339,8 +2502,8 @@ class TestTerraformProcessor:
                 "    }",
                 "",
                 "Plan: 1 to add, 0 to change, 0 to destroy.",
-            ]
-            + [""] * 20
+            ],
+            20,
         )  # pad to exceed 30 lines
         result = self.p.process("terraform plan", output)
         assert "Initializing" not in result
@@ -2349,7 +2512,7 @@ class TestTerraformProcessor:
         assert "Plan: 1 to add" in result
 
     def test_keeps_changed_attributes(self):
-        output = "\n".join(
+        output = _pad_blank_lines(
             [
                 "# aws_instance.web will be updated in-place",
                 '  ~ resource "aws_instance" "web" {',
@@ -2359,8 +2522,8 @@ class TestTerraformProcessor:
                 "    }",
                 "",
                 "Plan: 0 to add, 1 to change, 0 to destroy.",
-            ]
-            + [""] * 25
+            ],
+            25,
         )
         result = self.p.process("terraform plan", output)
         assert "t3.micro" in result
@@ -2368,28 +2531,34 @@ class TestTerraformProcessor:
         assert "Plan: 0 to add, 1 to change" in result
 
     def test_preserves_errors(self):
-        output = "\n".join(
+        output = _pad_blank_lines(
             [
                 "Error: Invalid instance type",
                 "",
                 "  on main.tf line 15:",
                 '  15:   instance_type = "t3.nonexistent"',
-            ]
-            + [""] * 30
+            ],
+            30,
         )
         result = self.p.process("terraform plan", output)
         assert "Error: Invalid instance type" in result
 
-    def test_can_handle_init_output_state(self):
-        assert self.p.can_handle("terraform init")
-        assert self.p.can_handle("terraform output")
-        assert self.p.can_handle("terraform state list")
-        assert self.p.can_handle("terraform state show aws_instance.web")
-        assert self.p.can_handle("tofu init")
-        assert self.p.can_handle("tofu output")
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "terraform init",
+            "terraform output",
+            "terraform state list",
+            "terraform state show aws_instance.web",
+            "tofu init",
+            "tofu output",
+        ],
+    )
+    def test_can_handle_init_output_state(self, command):
+        assert self.p.can_handle(command)
 
     def test_init_strips_noise_keeps_result(self):
-        output = "\n".join(
+        output = _pad_blank_lines(
             [
                 "Initializing the backend...",
                 "",
@@ -2401,8 +2570,8 @@ class TestTerraformProcessor:
                 "Terraform has been successfully initialized!",
                 "",
                 "You may now begin working with Terraform.",
-            ]
-            + [""] * 15
+            ],
+            15,
         )
         result = self.p.process("terraform init", output)
         assert "Initializing" not in result
@@ -2410,11 +2579,6 @@ class TestTerraformProcessor:
         assert "v5.31.0" in result
         assert "successfully initialized" in result
 
-    def test_init_short_unchanged(self):
-        output = "Terraform has been successfully initialized!"
-        result = self.p.process("terraform init", output)
-        assert result == output
-
     def test_output_truncates_long_values(self):
         lines = [f"key_{i} = " + "x" * 300 for i in range(40)]
         output = "\n".join(lines)
@@ -2422,25 +2586,12 @@ class TestTerraformProcessor:
         assert "chars" in result
         assert len(result) < len(output)
 
-    def test_output_short_unchanged(self):
-        output = 'db_host = "localhost"\ndb_port = 5432'
-        result = self.p.process("terraform output", output)
-        assert result == output
-
     def test_state_list_groups_by_type(self):
-        lines = [f"aws_instance.web_{i}" for i in range(20)]
-        lines += [f"aws_s3_bucket.data_{i}" for i in range(15)]
-        output = "\n".join(lines)
-        result = self.p.process("terraform state list", output)
+        result = self.p.process("terraform state list", _STATE_LIST_35)
         assert "35 resources in state" in result
         assert "aws_instance" in result
         assert "aws_s3_bucket" in result
 
-    def test_state_list_short_unchanged(self):
-        output = "aws_instance.web\naws_s3_bucket.data"
-        result = self.p.process("terraform state list", output)
-        assert result == output
-
     def test_state_show_truncates_long_attrs(self):
         lines = ["resource aws_instance.web:"]
         for i in range(50):
@@ -2452,15 +2603,15 @@ class TestTerraformProcessor:
 
     def test_subcommand_detection_not_fooled_by_args(self):
         """terraform plan -var init=true should NOT route to init handler."""
-        output = "\n".join(
+        output = _pad_blank_lines(
             [
                 "# aws_instance.web will be created",
                 '  + resource "aws_instance" "web" {',
                 '      + ami = "ami-12345"',
                 "    }",
                 "Plan: 1 to add, 0 to change, 0 to destroy.",
-            ]
-            + [""] * 30
+            ],
+            30,
         )
         result = self.p.process("terraform plan -var init=true", output)
         assert "Plan: 1 to add" in result
@@ -2470,36 +2621,35 @@ class TestGhProcessor:
     def setup_method(self):
         self.p = GhProcessor()
 
-    def test_can_handle(self):
-        assert self.p.can_handle("gh pr list")
-        assert self.p.can_handle("gh issue list")
-        assert self.p.can_handle("gh run view 12345")
-        assert self.p.can_handle("gh pr diff 42")
-        assert self.p.can_handle("gh pr checks")
-        assert not self.p.can_handle("git status")
-        assert not self.p.can_handle("gh auth login")
+    @pytest.mark.parametrize(
+        ("command", "expected"),
+        [
+            ("gh pr list", True),
+            ("gh issue list", True),
+            ("gh run view 12345", True),
+            ("gh pr diff 42", True),
+            ("gh pr checks", True),
+            ("git status", False),
+            ("gh auth login", False),
+        ],
+    )
+    def test_can_handle(self, command, expected):
+        assert self.p.can_handle(command) is expected
 
     def test_empty_output(self):
         assert self.p.process("gh pr list", "") == ""
 
     def test_pr_list_compresses_long_output(self):
-        lines = []
-        for i in range(40):
-            lines.append(f"{i}\tFix bug #{i}\tfeature/fix-{i}\tOPEN\t2025-01-{i % 28 + 1:02d}")
+        lines = [
+            f"{i}\tFix bug #{i}\tfeature/fix-{i}\tOPEN\t2025-01-{i % 28 + 1:02d}" for i in range(40)
+        ]
         output = "\n".join(lines)
         result = self.p.process("gh pr list", output)
         assert "more pr" in result
         assert len(result.splitlines()) < len(lines)
 
-    def test_pr_list_short_unchanged(self):
-        output = "1\tFix login\tmain\tOPEN\t2025-01-01\n2\tAdd tests\tmain\tOPEN\t2025-01-02"
-        result = self.p.process("gh pr list", output)
-        assert result == output
-
     def test_pr_list_preserves_all_fields(self):
-        lines = []
-        for i in range(20):
-            lines.append(f"{i}\tPR title {i}\tbranch-{i}\tOPEN\t2025-01-01")
+        lines = [f"{i}\tPR title {i}\tbranch-{i}\tOPEN\t2025-01-01" for i in range(20)]
         output = "\n".join(lines)
         result = self.p.process("gh pr list", output)
         # All 20 should be shown (< 30 threshold)
@@ -2507,9 +2657,7 @@ class TestGhProcessor:
         assert "PR title 19" in result
 
     def test_checks_collapses_passing(self):
-        lines = []
-        for i in range(15):
-            lines.append(f"✓  build-{i}\tpassing\t1m")
+        lines = [f"✓  build-{i}\tpassing\t1m" for i in range(15)]
         lines.append("✗  lint\tfailing\t30s")
         lines.append("○  deploy\tpending\t-")
         output = "\n".join(lines)
@@ -2520,11 +2668,6 @@ class TestGhProcessor:
         assert "Failed" in result
         assert "Pending" in result
 
-    def test_checks_short_unchanged(self):
-        output = "✓  build\tpassing\t1m\n✓  test\tpassing\t2m"
-        result = self.p.process("gh pr checks", output)
-        assert result == output
-
     def test_diff_compresses(self):
         lines = ["diff --git a/file.py b/file.py", "@@ -1,200 +1,200 @@"]
         for i in range(200):
@@ -2549,6 +2692,16 @@ class TestGhProcessor:
         assert "-removed_line" in result
 
 
+_PSQL_50_ROWS = "\n".join(
+    [
+        " id | name       | email",
+        "----+------------+------------------",
+        *(f" {i:2d} | user_{i:<6} | user{i}@example.com" for i in range(50)),
+        "(50 rows)",
+    ]
+)
+
+
 class TestDbQueryProcessor:
     def setup_method(self):
         self.p = DbQueryProcessor()
@@ -2564,24 +2717,11 @@ class TestDbQueryProcessor:
         assert self.p.process("psql", "") == ""
 
     def test_psql_table_compressed(self):
-        lines = [
-            " id | name       | email",
-            "----+------------+------------------",
-        ]
-        for i in range(50):
-            lines.append(f" {i:2d} | user_{i:<6} | user{i}@example.com")
-        lines.append("(50 rows)")
-        output = "\n".join(lines)
-        result = self.p.process("psql -c 'SELECT * FROM users'", output)
+        result = self.p.process("psql -c 'SELECT * FROM users'", _PSQL_50_ROWS)
         assert "rows omitted" in result
         assert "(50 rows)" in result
         assert "id | name" in result
-        assert len(result.splitlines()) < len(lines)
-
-    def test_psql_short_unchanged(self):
-        output = " id | name\n----+------\n  1 | Alice\n  2 | Bob\n(2 rows)"
-        result = self.p.process("psql", output)
-        assert result == output
+        assert len(result.splitlines()) < 53
 
     def test_mysql_table_compressed(self):
         lines = [
@@ -2598,11 +2738,6 @@ class TestDbQueryProcessor:
         assert "rows omitted" in result
         assert "50 rows in set" in result
 
-    def test_mysql_short_unchanged(self):
-        output = "+----+------+\n| id | name |\n+----+------+\n|  1 | Bob  |\n+----+------+"
-        result = self.p.process("mysql", output)
-        assert result == output
-
     def test_preserves_errors(self):
         output = "ERROR 1045 (28000): Access denied for user 'root'@'localhost'"
         result = self.p.process("mysql", output)
@@ -2618,10 +2753,65 @@ class TestDbQueryProcessor:
         assert "rows omitted" in result
         assert "id,name,email" in result
 
-    def test_csv_short_unchanged(self):
-        output = "id,name\n1,Alice\n2,Bob"
-        result = self.p.process("sqlite3 -csv", output)
-        assert result == output
+
+# aws ec2 describe-instances: 10 instances with 5 network interfaces each
+_EC2_DESCRIBE_JSON = json.dumps(
+    {
+        "Reservations": [
+            {
+                "Instances": [
+                    {
+                        "InstanceId": f"i-{i:012d}",
+                        "State": {"Name": "running"},
+                        "Tags": [{"Key": "Name", "Value": f"server-{i}"}],
+                        "NetworkInterfaces": [
+                            {
+                                "SubnetId": f"subnet-{j:08d}",
+                                "PrivateIpAddress": f"10.0.{i}.{j}",
+                                "Groups": [
+                                    {"GroupId": f"sg-{j:08d}", "GroupName": f"group-{j}"},
+                                ],
+                            }
+                            for j in range(5)
+                        ],
+                    }
+                    for i in range(10)
+                ]
+            }
+        ]
+    },
+    indent=2,
+)
+_AWS_ERROR_JSON = json.dumps(
+    {
+        "error": {
+            "code": "UnauthorizedAccess",
+            "message": "User is not authorized to perform this operation",
+        }
+    },
+    indent=2,
+)
+# Identifier/state fields must survive even when nested data is truncated
+_AWS_INSTANCE_JSON = json.dumps(
+    {
+        "InstanceId": "i-abc123def456",
+        "State": {"Name": "stopped", "Code": 80},
+        "arn": "arn:aws:ec2:us-east-1:123456789:instance/i-abc123def456",
+        "VeryDeepField": {"Level1": {"Level2": {"Level3": {"Level4": {"data": "deep value"}}}}},
+    },
+    indent=2,
+)
+
+_AWS_TABLE_30 = "\n".join(
+    [
+        "+---+---+---+",
+        "| InstanceId | State | Name |",
+        "+---+---+---+",
+        *(f"| i-{i:010d} | running | server-{i} |" for i in range(30)),
+        "+---+---+---+",
+    ]
+)
+_AWS_TEXT_50 = "\n".join([f"i-{i:012d}\trunning\tserver-{i}\tt3.micro" for i in range(50)])
 
 
 class TestCloudCliProcessor:
@@ -2639,99 +2829,156 @@ class TestCloudCliProcessor:
         assert self.p.process("aws ec2 describe-instances", "") == ""
 
     def test_json_compressed(self):
-        import json
-
-        data = {
-            "Reservations": [
-                {
-                    "Instances": [
-                        {
-                            "InstanceId": f"i-{i:012d}",
-                            "State": {"Name": "running"},
-                            "Tags": [{"Key": "Name", "Value": f"server-{i}"}],
-                            "NetworkInterfaces": [
-                                {
-                                    "SubnetId": f"subnet-{j:08d}",
-                                    "PrivateIpAddress": f"10.0.{i}.{j}",
-                                    "Groups": [
-                                        {"GroupId": f"sg-{j:08d}", "GroupName": f"group-{j}"},
-                                    ],
-                                }
-                                for j in range(5)
-                            ],
-                        }
-                        for i in range(10)
-                    ]
-                }
-            ]
-        }
-        output = json.dumps(data, indent=2)
-        result = self.p.process("aws ec2 describe-instances", output)
+        result = self.p.process("aws ec2 describe-instances", _EC2_DESCRIBE_JSON)
         assert "i-" in result
         assert "running" in result
-        assert len(result) < len(output)
-
-    def test_json_short_unchanged(self):
-        output = '{"InstanceId": "i-123", "State": "running"}'
-        result = self.p.process("aws ec2 describe-instances", output)
-        # Short JSON should be parsed and re-serialized but not truncated
-        assert "i-123" in result
-        assert "running" in result
-
-    def test_preserves_errors(self):
-        import json
-
-        data = {
-            "error": {
-                "code": "UnauthorizedAccess",
-                "message": "User is not authorized to perform this operation",
-            }
-        }
-        output = json.dumps(data, indent=2)
-        result = self.p.process("aws ec2 describe-instances", output)
-        assert "UnauthorizedAccess" in result
-        assert "not authorized" in result
-
-    def test_preserves_state_and_id_fields(self):
-        import json
-
-        data = {
-            "InstanceId": "i-abc123def456",
-            "State": {"Name": "stopped", "Code": 80},
-            "arn": "arn:aws:ec2:us-east-1:123456789:instance/i-abc123def456",
-            "VeryDeepField": {"Level1": {"Level2": {"Level3": {"Level4": {"data": "deep value"}}}}},
-        }
-        output = json.dumps(data, indent=2)
+        assert len(result) < len(_EC2_DESCRIBE_JSON)
+
+    @pytest.mark.parametrize(
+        ("output", "expected"),
+        [
+            # Short JSON is parsed and re-serialized but not truncated
+            pytest.param(
+                '{"InstanceId": "i-123", "State": "running"}',
+                ("i-123", "running"),
+                id="short",
+            ),
+            pytest.param(_AWS_ERROR_JSON, ("UnauthorizedAccess", "not authorized"), id="error"),
+            pytest.param(
+                _AWS_INSTANCE_JSON, ("i-abc123def456", "stopped", "arn:aws:ec2"), id="state-and-id"
+            ),
+        ],
+    )
+    def test_json_preserves_fields(self, output, expected):
         result = self.p.process("aws ec2 describe-instances", output)
-        assert "i-abc123def456" in result
-        assert "stopped" in result
-        assert "arn:aws:ec2" in result
+        _assert_all_in(expected, result)
 
     def test_table_output_compressed(self):
-        lines = [
-            "+---+---+---+",
-            "| InstanceId | State | Name |",
-            "+---+---+---+",
-        ]
-        for i in range(30):
-            lines.append(f"| i-{i:010d} | running | server-{i} |")
-        lines.append("+---+---+---+")
-        output = "\n".join(lines)
-        result = self.p.process("aws ec2 describe-instances --output table", output)
+        result = self.p.process("aws ec2 describe-instances --output table", _AWS_TABLE_30)
         assert "more rows" in result
-        assert len(result.splitlines()) < len(lines)
+        assert len(result.splitlines()) < 34
 
     def test_text_output_compressed(self):
-        lines = [f"i-{i:012d}\trunning\tserver-{i}\tt3.micro" for i in range(50)]
-        output = "\n".join(lines)
-        result = self.p.process("aws ec2 describe-instances --output text", output)
+        result = self.p.process("aws ec2 describe-instances --output text", _AWS_TEXT_50)
         assert "omitted" in result
-        assert len(result.splitlines()) < len(lines)
+        assert len(result.splitlines()) < 50
 
-    def test_text_short_unchanged(self):
-        output = "i-123\trunning\tserver-1"
-        result = self.p.process("aws ec2 describe-instances --output text", output)
-        assert result == output
+
+# Inputs below each processor's compression threshold must come back verbatim
+_SHORT_UNCHANGED_CASES = [
+    pytest.param(
+        PackageListProcessor(),
+        "pip list",
+        "\n".join(
+            [
+                "Package  Version",
+                "-------- -------",
+                "pip      23.0",
+                "setuptools 67.0",
+            ]
+        ),
+        id="pip list",
+    ),
+    pytest.param(
+        SearchProcessor(),
+        "grep -r pattern .",
+        "\n".join([f"src/file{i}.py:10:match here" for i in range(5)]),
+        id="grep -r pattern .",
+    ),
+    pytest.param(
+        SearchProcessor(),
+        "fd -e py",
+        "src/main.py\nsrc/util.py\nsrc/app.py",
+        id="fd -e py",
+    ),
+    pytest.param(
+        KubectlProcessor(),
+        "kubectl delete pod test-pod",
+        "pod/test-pod deleted",
+        id="kubectl delete pod test-pod",
+    ),
+    pytest.param(
+        EnvProcessor(),
+        "env",
+        "\n".join([f"VAR{i}=val{i}" for i in range(5)]),
+        id="env",
+    ),
+    pytest.param(
+        SystemInfoProcessor(), "du -sh *", "4K\tdir1\n8K\tdir2\n12K\ttotal", id="du -sh *"
+    ),
+    pytest.param(
+        TerraformProcessor(),
+        "terraform plan",
+        "No changes. Infrastructure is up-to-date.",
+        id="terraform plan",
+    ),
+    pytest.param(
+        TerraformProcessor(),
+        "terraform init",
+        "Terraform has been successfully initialized!",
+        id="terraform init",
+    ),
+    pytest.param(
+        TerraformProcessor(),
+        "terraform output",
+        'db_host = "localhost"\ndb_port = 5432',
+        id="terraform output",
+    ),
+    pytest.param(
+        TerraformProcessor(),
+        "terraform state list",
+        "aws_instance.web\naws_s3_bucket.data",
+        id="terraform state list",
+    ),
+    pytest.param(
+        GhProcessor(),
+        "gh pr list",
+        "1\tFix login\tmain\tOPEN\t2025-01-01\n2\tAdd tests\tmain\tOPEN\t2025-01-02",
+        id="gh pr list",
+    ),
+    pytest.param(
+        GhProcessor(),
+        "gh pr checks",
+        "✓  build\tpassing\t1m\n✓  test\tpassing\t2m",
+        id="gh pr checks",
+    ),
+    pytest.param(
+        DbQueryProcessor(),
+        "psql",
+        " id | name\n----+------\n  1 | Alice\n  2 | Bob\n(2 rows)",
+        id="psql",
+    ),
+    pytest.param(
+        DbQueryProcessor(),
+        "mysql",
+        "+----+------+\n| id | name |\n+----+------+\n|  1 | Bob  |\n+----+------+",
+        id="mysql",
+    ),
+    pytest.param(DbQueryProcessor(), "sqlite3 -csv", "id,name\n1,Alice\n2,Bob", id="sqlite3 -csv"),
+    pytest.param(
+        CloudCliProcessor(),
+        "aws ec2 describe-instances --output text",
+        "i-123\trunning\tserver-1",
+        id="aws ec2 describe-instances --output text",
+    ),
+]
+
+
+class TestShortOutputUnchanged:
+    @pytest.mark.parametrize(("processor", "command", "output"), _SHORT_UNCHANGED_CASES)
+    def test_short_output_unchanged(self, processor, command, output):
+        assert processor.process(command, output) == output
+
+
+# 8 remotes, each listed once for fetch and once for push
+_REMOTE_8_FETCH_PUSH = "\n".join(
+    line
+    for i in range(8)
+    for line in (
+        f"remote-{i}\thttps://github.com/user/repo-{i}.git (fetch)",
+        f"remote-{i}\thttps://github.com/user/repo-{i}.git (push)",
+    )
+)
 
 
 class TestGitRemoteProcessor:
@@ -2740,9 +2987,15 @@ class TestGitRemoteProcessor:
     def setup_method(self):
         self.p = GitProcessor()
 
-    def test_can_handle_remote(self):
-        assert self.p.can_handle("git remote -v")
-        assert self.p.can_handle("git remote")
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "git remote -v",
+            "git remote",
+        ],
+    )
+    def test_can_handle_remote(self, command):
+        assert self.p.can_handle(command)
 
     def test_remote_short_unchanged(self):
         output = (
@@ -2753,16 +3006,9 @@ class TestGitRemoteProcessor:
         assert result == output
 
     def test_remote_deduplicates_fetch_push(self):
-        lines = []
-        for i in range(8):
-            lines.append(f"remote-{i}\thttps://github.com/user/repo-{i}.git (fetch)")
-            lines.append(f"remote-{i}\thttps://github.com/user/repo-{i}.git (push)")
-        output = "\n".join(lines)
-        result = self.p.process("git remote -v", output)
-        assert "fetch/push deduplicated" in result
-        assert "remote-0" in result
-        assert "remote-7" in result
-        assert len(result.splitlines()) < len(lines)
+        result = self.p.process("git remote -v", _REMOTE_8_FETCH_PUSH)
+        _assert_all_in(("fetch/push deduplicated", "remote-0", "remote-7"), result)
+        assert len(result.splitlines()) < 16
 
 
 class TestGitTypechange:
@@ -2781,8 +3027,7 @@ class TestGitTypechange:
             ]
         )
         result = self.p.process("git status", output)
-        assert "link.py" in result
-        assert "T" in result
+        _assert_all_in(("link.py", "T"), result)
 
 
 class TestGitStatusShortBranch:
@@ -2823,9 +3068,7 @@ class TestGitDiffStatGrouping:
 
     def test_stat_many_files_grouped(self):
         """git diff --stat with 50+ files should group by directory."""
-        lines = []
-        for i in range(25):
-            lines.append(f" src/components/file{i}.tsx | 10 ++++------")
+        lines = [f" src/components/file{i}.tsx | 10 ++++------" for i in range(25)]
         for i in range(25):
             lines.append(f" src/utils/helper{i}.ts | 5 ++---")
         lines.append(" 50 files changed, 375 insertions(+), 375 deletions(-)")
@@ -2962,9 +3205,10 @@ class TestTscTypecheck:
 
     def test_tsc_noemit_errors_grouped(self):
         """tsc --noEmit with many errors should group by code."""
-        lines = []
-        for i in range(30):
-            lines.append(f"src/file{i}.ts(10,5): error TS2322: Type 'string' is not assignable.")
+        lines = [
+            f"src/file{i}.ts(10,5): error TS2322: Type 'string' is not assignable."
+            for i in range(30)
+        ]
         for i in range(15):
             lines.append(
                 f"src/util{i}.ts:5:3 - error TS2345: Argument of type 'number' not assignable."
@@ -3089,8 +3333,6 @@ class TestGhApiHandling:
         assert self.p.can_handle("gh api repos/owner/repo/pulls")
 
     def test_gh_api_json_compression(self):
-        import json
-
         data = {
             "id": 1,
             "title": "Test PR",
@@ -3115,9 +3357,7 @@ class TestSearchExtensionless:
         self.p = SearchProcessor()
 
     def test_extensionless_file_grouped(self):
-        lines = []
-        for i in range(25):
-            lines.append(f"bin/mycommand:{i + 1}:pattern match line {i}")
+        lines = [f"bin/mycommand:{i + 1}:pattern match line {i}" for i in range(25)]
         output = "\n".join(lines)
         result = self.p.process("grep -r pattern .", output)
         assert "bin/mycommand" in result
@@ -3131,8 +3371,6 @@ class TestCloudCliImportantKeys:
         self.p = CloudCliProcessor()
 
     def test_instance_id_preserved_at_depth(self):
-        import json
-
         data = {
             "Reservations": [
                 {
@@ -3713,9 +3951,9 @@ class TestGoProcessor:
         assert "main.go:20:10" in result
 
     def test_go_vet_groups_warnings(self):
-        warnings = []
-        for i in range(6):
-            warnings.append(f"pkg/file{i}.go:{i + 1}:5: printf format %d has arg of wrong type")
+        warnings = [
+            f"pkg/file{i}.go:{i + 1}:5: printf format %d has arg of wrong type" for i in range(6)
+        ]
         for i in range(3):
             warnings.append(f"pkg/util{i}.go:{i + 1}:3: unreachable code")
         output = "\n".join(warnings)
@@ -3866,15 +4104,11 @@ class TestJqYqProcessor:
 
     def test_jq_small_output_passthrough(self):
         data = {"key": "value", "count": 42}
-        import json
-
         output = json.dumps(data, indent=2)
         result = self.p.process("jq . file.json", output)
         assert result == output
 
     def test_jq_large_json_compressed(self):
-        import json
-
         data = [
             {"id": i, "name": f"item-{i}", "data": {"nested": "value" * 10}} for i in range(100)
         ]
@@ -3884,8 +4118,6 @@ class TestJqYqProcessor:
         assert len(result) < len(output)
 
     def test_jq_streaming_output(self):
-        import json
-
         lines = [json.dumps({"id": i, "name": f"item-{i}"}) for i in range(100)]
         output = "\n".join(lines)
         result = self.p.process("jq -c '.[]' file.json", output)
@@ -3941,9 +4173,7 @@ class TestPythonInstallProcessor:
         assert self.p.process("pip install flask", "") == ""
 
     def test_pip_install_compressed(self):
-        lines = []
-        for i in range(30):
-            lines.append(f"Collecting package-{i}>=1.0")
+        lines = [f"Collecting package-{i}>=1.0" for i in range(30)]
         for i in range(30):
             lines.append(f"  Downloading package_{i}-1.2.3-py3-none-any.whl (10 kB)")
         lines.append("Installing collected packages: " + ", ".join(f"p{i}" for i in range(30)))
@@ -4143,9 +4373,7 @@ class TestMavenGradleProcessor:
         assert "Tests run: 42" in result
 
     def test_gradle_tasks_compressed(self):
-        lines = []
-        for i in range(20):
-            lines.append(f"> Task :sub{i}:compileJava UP-TO-DATE")
+        lines = [f"> Task :sub{i}:compileJava UP-TO-DATE" for i in range(20)]
         lines.append("> Task :app:compileJava")
         lines.append("> Task :app:processResources NO-SOURCE")
         lines.append("> Task :app:jar")
@@ -4206,8 +4434,6 @@ class TestStructuredLogProcessor:
         assert self.p.process("stern my-pod", "") == ""
 
     def test_json_lines_compressed(self):
-        import json
-
         lines = []
         for i in range(30):
             entry = {
@@ -4240,8 +4466,6 @@ class TestStructuredLogProcessor:
         assert len(result) < len(output)
 
     def test_mixed_json_non_json(self):
-        import json
-
         lines = ["plain text line"]
         for i in range(20):
             lines.append(json.dumps({"level": "info", "msg": f"msg {i}"}))
@@ -4251,11 +4475,7 @@ class TestStructuredLogProcessor:
         assert "log entries" in result
 
     def test_error_messages_shown(self):
-        import json
-
-        lines = []
-        for i in range(10):
-            lines.append(json.dumps({"level": "info", "msg": f"ok {i}"}))
+        lines = [json.dumps({"level": "info", "msg": f"ok {i}"}) for i in range(10)]
         lines.append(json.dumps({"level": "error", "msg": "database connection failed"}))
         output = "\n".join(lines)
 
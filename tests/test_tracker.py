@@ -2,6 +2,7 @@
 
 import json
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -9,6 +10,7 @@ import threading
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src import stats
 from src.tracker import SavingsTracker
 
 
@@ -22,15 +24,7 @@ class TestSavingsTracker:
 
     def teardown_method(self):
         self.tracker.close()
-        db_path = os.path.join(self.tmp_dir, "test_savings.db")
-        if os.path.exists(db_path):
-            os.remove(db_path)
-        # Clean up WAL files
-        for ext in ("-wal", "-shm"):
-            wal = db_path + ext
-            if os.path.exists(wal):
-                os.remove(wal)
-        os.rmdir(self.tmp_dir)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
 
     def test_record_and_retrieve(self):
         self.tracker.record_saving(
@@ -223,6 +217,11 @@ class TestSavingsTracker:
         assert lifetime["commands"] == 2
         t2.close()
 
+    def test_wal_with_normal_sync(self):
+        assert self.tracker.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # PRAGMA synchronous reports NORMAL as 1
+        assert self.tracker.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
     def test_db_recreation_on_corruption(self):
         """If DB is corrupted, it should be recreated."""
         self.tracker.close()
@@ -255,25 +254,17 @@ class TestStatsCLI:
         )
 
     def teardown_method(self):
-        db_path = os.path.join(self.tmp_dir, "savings.db")
-        for f in (db_path, db_path + "-wal", db_path + "-shm"):
-            if os.path.exists(f):
-                os.remove(f)
-        os.rmdir(self.tmp_dir)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
         SavingsTracker.DB_DIR = self.original_db_dir
         SavingsTracker.DB_PATH = self.original_db_path
 
-    def _run_stats(self, *args):
-        """Run stats.py and return stdout."""
-        env = os.environ.copy()
-        env["TOKEN_SAVER_DB_DIR"] = self.tmp_dir
-        result = subprocess.run(  # noqa: S603, PLW1510
-            [sys.executable, self.stats_script, *args],
-            capture_output=True,
-            text=True,
-            env=env,
-        )
-        return result
+    def _run_stats(self, capsys, monkeypatch, *args):
+        """Run stats.main() in-process against tmp_dir and return its stdout."""
+        # main() reads TOKEN_SAVER_DB_DIR; pin it so an exported value can't
+        # point the tests at a real savings.db
+        monkeypatch.setenv("TOKEN_SAVER_DB_DIR", self.tmp_dir)
+        stats.main(list(args))
+        return capsys.readouterr().out
 
     def _seed_data(self):
         """Insert test data into the DB."""
@@ -283,35 +274,43 @@ class TestStatsCLI:
         tracker.record_saving("git diff", "git", 10000, 2000, "claude_code")
         tracker.close()
 
-    def test_empty_db_human(self):
-        result = self._run_stats()
-        assert result.returncode == 0
-        assert "Token-Saver Savings" in result.stdout
-        assert "No compressions" in result.stdout
-
-    def test_empty_db_json(self):
-        result = self._run_stats("--json")
+    def test_script_entry_point(self):
+        """Running stats.py as a script reads argv and TOKEN_SAVER_DB_DIR."""
+        env = os.environ.copy()
+        env["TOKEN_SAVER_DB_DIR"] = self.tmp_dir
+        result = subprocess.run(  # noqa: S603, PLW1510
+            [sys.executable, self.stats_script, "--json"],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
         assert result.returncode == 0
         data = json.loads(result.stdout)
+        assert data["lifetime"]["commands"] == 0
+
+    def test_empty_db_human(self, capsys, monkeypatch):
+        stdout = self._run_stats(capsys, monkeypatch)
+        assert "Token-Saver Savings" in stdout
+        assert "No compressions" in stdout
+
+    def test_empty_db_json(self, capsys, monkeypatch):
+        data = json.loads(self._run_stats(capsys, monkeypatch, "--json"))
         assert data["session"]["commands"] == 0
         assert data["lifetime"]["commands"] == 0
         assert data["top_processors"] == []
 
-    def test_with_data_human(self):
+    def test_with_data_human(self, capsys, monkeypatch):
         self._seed_data()
-        result = self._run_stats()
-        assert result.returncode == 0
-        assert "Token-Saver Savings" in result.stdout
-        assert "Total commands:" in result.stdout
-        assert "Tokens saved:" in result.stdout
-        assert "By Command" in result.stdout
-        assert "git" in result.stdout
-
-    def test_with_data_json(self):
+        stdout = self._run_stats(capsys, monkeypatch)
+        assert "Token-Saver Savings" in stdout
+        assert "Total commands:" in stdout
+        assert "Tokens saved:" in stdout
+        assert "By Command" in stdout
+        assert "git" in stdout
+
+    def test_with_data_json(self, capsys, monkeypatch):
         self._seed_data()
-        result = self._run_stats("--json")
-        assert result.returncode == 0
-        data = json.loads(result.stdout)
+        data = json.loads(self._run_stats(capsys, monkeypatch, "--json"))
         assert data["lifetime"]["commands"] == 3
         assert data["lifetime"]["original"] == 18000
         assert data["lifetime"]["compressed"] == 3300
@@ -325,10 +324,14 @@ class TestStatsCLI:
         assert "total_saved" in data["top_commands"][0]
         assert "avg_ratio" in data["top_commands"][0]
 
-    def test_top_processors_order(self):
+    def test_session_flag(self, capsys, monkeypatch):
         self._seed_data()
-        result = self._run_stats("--json")
-        data = json.loads(result.stdout)
+        data = json.loads(self._run_stats(capsys, monkeypatch, "--session", "test-stats", "--json"))
+        assert data["session"]["commands"] == 3
+
+    def test_top_processors_order(self, capsys, monkeypatch):
+        self._seed_data()
+        data = json.loads(self._run_stats(capsys, monkeypatch, "--json"))
         # git saved 12500 (5000-500 + 10000-2000), test saved 2200 (3000-800)
         assert data["top_processors"][0]["processor"] == "git"
         assert data["top_processors"][1]["processor"] == "test"